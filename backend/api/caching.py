@@ -0,0 +1,22 @@
+"""
+HTTP caching helpers for read-only API routes.
+"""
+
+import json
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from core.utils import cache_key
+
+def etag_json_response(request: Request, payload: Any) -> Response:
+    """Return payload as JSON with an ETag, or an empty 304 if the client's copy is current."""
+    body = json.dumps(jsonable_encoder(payload), separators=(',', ':'))
+    etag = f'"{cache_key(body)}"'
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type='application/json', headers=headers)
@@ -2,17 +2,19 @@
 Agents API routes.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from typing import List
 
 from models.responses import AgentsResponse
 from services.agent_service import AgentService
+from api.caching import etag_json_response
 from api.dependencies import get_agent_service
 
 router = APIRouter()
 
 @router.get("/info", response_model=AgentsResponse)
 async def get_agents_info(
+    request: Request,
     agent_service: AgentService = Depends(get_agent_service)
 ):
     """
@@ -23,7 +25,7 @@ async def get_agents_info(
     """
     try:
         agents_info = await agent_service.get_agents_info()
-        return agents_info
+        return etag_json_response(request, agents_info)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get agents info: {str(e)}")
@@ -94,6 +96,7 @@ async def get_agents_summary(
 @router.get("/{agent_name}")
 async def get_agent_details(
     agent_name: str,
+    request: Request,
     agent_service: AgentService = Depends(get_agent_service)
 ):
     """
@@ -110,11 +113,11 @@ async def get_agent_details(
         description = await agent_service.get_agent_description(agent_name)
         capabilities = await agent_service.get_agent_capabilities(agent_name)
         
-        return {
+        return etag_json_response(request, {
             "agent_name": agent_name,
             "description": description,
             "capabilities": capabilities
-        }
+        })
         
     except HTTPException:
         raise
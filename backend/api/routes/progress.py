@@ -2,19 +2,29 @@
 Progress API routes with WebSocket support.
 """
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from typing import Dict, List
 import asyncio
 import json
 import logging
+import time
 
 from models.responses import ProgressResponse
 from services.progress_service import ProgressService
+from api.caching import etag_json_response
 from api.dependencies import get_progress_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Long-poll limits: longest a request may be held, and how often it re-checks
+LONGPOLL_MAX_WAIT = 60.0
+LONGPOLL_CHECK_INTERVAL = 0.2
+# Server-sent event stream: the current snapshot is re-sent after this much silence
+STREAM_HEARTBEAT = 15.0
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
@@ -57,9 +67,17 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+def step_columns(progress: ProgressResponse) -> Dict[str, list]:
+    """Step statuses and progress as parallel lists, so clients can redraw steps without walking step dicts."""
+    return {
+        "status": [step.status.value for step in progress.steps],
+        "progress": [step.progress_percentage for step in progress.steps]
+    }
+
 @router.get("/{project_id}", response_model=ProgressResponse)
 async def get_project_progress(
     project_id: str,
+    request: Request,
     progress_service: ProgressService = Depends(get_progress_service)
 ):
     """
@@ -74,13 +92,111 @@ async def get_project_progress(
         if not progress:
             raise HTTPException(status_code=404, detail="Project progress not found")
         
-        return progress
+        return etag_json_response(request, progress)
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get project progress: {str(e)}")
 
+@router.get("/{project_id}/longpoll")
+async def long_poll_project_progress(
+    project_id: str,
+    since: int = -1,
+    wait: float = 25.0,
+    progress_service: ProgressService = Depends(get_progress_service)
+):
+    """
+    Wait for a project's progress to change, then return it.
+    
+    The request is held until the progress sequence number exceeds `since`
+    or `wait` seconds pass. The latest progress is returned either way,
+    together with its sequence number for the next call, and with the
+    project result once the project has completed.
+    """
+    try:
+        if not progress_service.get_project_progress(project_id):
+            raise HTTPException(status_code=404, detail="Project progress not found")
+        
+        deadline = time.monotonic() + min(max(wait, 0.0), LONGPOLL_MAX_WAIT)
+        while (progress_service.get_progress_seq(project_id) <= since and
+               time.monotonic() < deadline):
+            await asyncio.sleep(LONGPOLL_CHECK_INTERVAL)
+        
+        # Read the sequence first so the snapshot is never older than it
+        seq = progress_service.get_progress_seq(project_id)
+        progress = progress_service.get_project_progress(project_id)
+        if not progress:
+            raise HTTPException(status_code=404, detail="Project progress not found")
+        
+        update = {
+            "seq": seq,
+            "progress": progress,
+            "step_columns": step_columns(progress)
+        }
+        # Piggyback the result on a completed update so clients need no extra request
+        if progress.is_completed:
+            result = progress_service.get_project_result(project_id)
+            if result:
+                update["result"] = result
+        
+        return update
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to long-poll project progress: {str(e)}")
+
+@router.get("/{project_id}/stream")
+async def stream_project_progress(
+    project_id: str,
+    since: int = -1,
+    progress_service: ProgressService = Depends(get_progress_service)
+):
+    """
+    Stream a project's progress as server-sent events.
+    
+    A `data:` frame holding {"seq", "progress"} is sent whenever the progress
+    sequence number moves past the last one sent, and the current snapshot is
+    repeated every STREAM_HEARTBEAT seconds while nothing changes. The stream
+    ends once the project completes or fails; a completed frame also carries
+    the project "result" when it is available.
+    """
+    if not progress_service.get_project_progress(project_id):
+        raise HTTPException(status_code=404, detail="Project progress not found")
+    
+    async def events():
+        last_seq = since
+        last_sent = time.monotonic()
+        while True:
+            seq = progress_service.get_progress_seq(project_id)
+            if seq > last_seq or time.monotonic() - last_sent >= STREAM_HEARTBEAT:
+                progress = progress_service.get_project_progress(project_id)
+                if not progress:
+                    break
+                
+                update = {"seq": seq, "progress": progress, "step_columns": step_columns(progress)}
+                if progress.is_completed:
+                    result = progress_service.get_project_result(project_id)
+                    if result:
+                        update["result"] = result
+                
+                # Encode like the REST routes so datetimes stay ISO 8601
+                payload = json.dumps(jsonable_encoder(update), separators=(',', ':'))
+                yield f"data: {payload}\n\n"
+                last_seq, last_sent = seq, time.monotonic()
+                
+                if progress.is_completed or progress.has_failures:
+                    break
+            await asyncio.sleep(LONGPOLL_CHECK_INTERVAL)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering or caching the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/{project_id}/logs")
 async def get_project_logs(
     project_id: str,
@@ -137,46 +253,50 @@ async def websocket_endpoint(
     WebSocket endpoint for real-time progress updates.
     
     This WebSocket endpoint provides real-time progress updates for a specific project.
-    Clients can connect to receive live updates about pipeline execution progress.
+    A progress_update message is pushed as soon as the project's progress changes,
+    tagged with its change sequence number.
     """
     await manager.connect(websocket, project_id)
     
     try:
-        # Send initial progress state
-        initial_progress = progress_service.get_project_progress(project_id)
-        if initial_progress:
-            await manager.send_personal_message(
-                json.dumps({
-                    "type": "progress_update",
-                    "project_id": project_id,
-                    "data": initial_progress.dict()
-                }),
-                websocket
-            )
-        
-        # Keep connection alive and send periodic updates
-        while True:
-            try:
-                # Wait for any message from client (heartbeat)
-                await asyncio.wait_for(websocket.receive_text(), timeout=5.0)
-            except asyncio.TimeoutError:
-                # Send periodic progress updates
-                current_progress = progress_service.get_project_progress(project_id)
-                if current_progress:
-                    await manager.send_personal_message(
-                        json.dumps({
-                            "type": "progress_update",
-                            "project_id": project_id,
-                            "data": current_progress.dict(),
-                            "timestamp": current_progress.logs[-1]["timestamp"] if current_progress.logs else None
-                        }),
-                        websocket
-                    )
-            except WebSocketDisconnect:
-                break
-            except Exception as e:
-                logger.error(f"WebSocket error for project {project_id}: {str(e)}")
-                break
+        last_seq = None
+        last_sent = time.monotonic()
+        # One receive stays pending across change checks; cancelling it on every
+        # check would tear down the receive each LONGPOLL_CHECK_INTERVAL
+        receive = asyncio.ensure_future(websocket.receive_text())
+        try:
+            while True:
+                # Push a snapshot whenever the progress sequence has moved, and
+                # repeat it after STREAM_HEARTBEAT seconds of silence
+                seq = progress_service.get_progress_seq(project_id)
+                if seq != last_seq or time.monotonic() - last_sent >= STREAM_HEARTBEAT:
+                    current_progress = progress_service.get_project_progress(project_id)
+                    if current_progress:
+                        await manager.send_personal_message(
+                            json.dumps(jsonable_encoder({
+                                "type": "progress_update",
+                                "project_id": project_id,
+                                "seq": seq,
+                                "data": current_progress,
+                                "timestamp": current_progress.logs[-1]["timestamp"] if current_progress.logs else None
+                            }), separators=(',', ':')),
+                            websocket
+                        )
+                        last_seq, last_sent = seq, time.monotonic()
+                
+                # Client messages are heartbeats; wait for one between change checks
+                done, _ = await asyncio.wait({receive}, timeout=LONGPOLL_CHECK_INTERVAL)
+                if done:
+                    try:
+                        receive.result()
+                    except WebSocketDisconnect:
+                        break
+                    except Exception as e:
+                        logger.error(f"WebSocket error for project {project_id}: {str(e)}")
+                        break
+                    receive = asyncio.ensure_future(websocket.receive_text())
+        finally:
+            receive.cancel()
                 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for project {project_id}")
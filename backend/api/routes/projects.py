@@ -2,28 +2,41 @@
 Projects API routes.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from typing import Optional
+import asyncio
 
 from models.requests import ProjectQueryRequest
 from models.responses import ProjectHistoryResponse, ProjectResult
+from services.pipeline_service import PipelineService
 from services.project_service import ProjectService
-from api.dependencies import get_project_service
+from api.caching import etag_json_response
+from api.dependencies import get_pipeline_service, get_project_service
 
 router = APIRouter()
 
+def preview_history(history: ProjectHistoryResponse, input_preview: Optional[int]) -> ProjectHistoryResponse:
+    """Cut each project's user input down to its first input_preview characters."""
+    if input_preview:
+        for project in history.projects:
+            if len(project.user_input) > input_preview:
+                project.user_input = project.user_input[:input_preview] + "..."
+    return history
+
 @router.get("/history", response_model=ProjectHistoryResponse)
 async def get_project_history(
     limit: int = Query(10, ge=1, le=100, description="Number of projects to return"),
     offset: int = Query(0, ge=0, description="Number of projects to skip"),
     filter_success: Optional[bool] = Query(None, description="Filter by success status"),
+    input_preview: Optional[int] = Query(None, ge=1, description="Truncate each user input to this many characters"),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """
     Get project history with filtering and pagination.
     
     This endpoint returns the history of all projects with optional filtering
-    by success status and pagination support.
+    by success status and pagination support. Pass input_preview to receive
+    only the start of each user input when listing.
     """
     try:
         query = ProjectQueryRequest(
@@ -33,13 +46,14 @@ async def get_project_history(
         )
         
         history = await project_service.get_project_history(query)
-        return history
+        return preview_history(history, input_preview)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get project history: {str(e)}")
 
 @router.get("/statistics")
 async def get_project_statistics(
+    request: Request,
     project_service: ProjectService = Depends(get_project_service)
 ):
     """
@@ -50,13 +64,14 @@ async def get_project_statistics(
     """
     try:
         stats = await project_service.get_project_statistics()
-        return stats
+        return etag_json_response(request, stats)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get project statistics: {str(e)}")
 
 @router.get("/recent")
 async def get_recent_projects(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Number of recent projects to return"),
     project_service: ProjectService = Depends(get_project_service)
 ):
@@ -68,14 +83,44 @@ async def get_recent_projects(
     try:
         recent_projects = await project_service.get_recent_projects(limit)
         
-        return {
+        return etag_json_response(request, {
             "recent_projects": recent_projects,
             "count": len(recent_projects)
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get recent projects: {str(e)}")
 
+@router.get("/dashboard")
+async def get_dashboard(
+    request: Request,
+    history_limit: int = Query(20, ge=1, le=100, description="Number of history entries to return"),
+    input_preview: int = Query(200, ge=1, description="Truncate each history user input to this many characters"),
+    pipeline_service: PipelineService = Depends(get_pipeline_service),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    """
+    Get pipeline status, project statistics and history in one response.
+    
+    This endpoint bundles the data the dashboard pages need so they can
+    load with a single request.
+    """
+    try:
+        pipeline_status, stats, history = await asyncio.gather(
+            pipeline_service.get_pipeline_status(),
+            project_service.get_project_statistics(),
+            project_service.get_project_history(ProjectQueryRequest(limit=history_limit, offset=0))
+        )
+        
+        return etag_json_response(request, {
+            "pipeline_status": pipeline_status,
+            "statistics": stats,
+            "history": preview_history(history, input_preview)
+        })
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get dashboard: {str(e)}")
+
 @router.get("/search")
 async def search_projects(
     q: str = Query(..., min_length=1, description="Search query"),
@@ -4,26 +4,70 @@ Utility functions for the Multi-Agent Framework.
 
 import json
 import os
+import re
+import hashlib
+import atexit
+import queue
 import logging
+import logging.handlers
+import threading
+import time
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+try:
+    import xxhash
+except ImportError:  # Optional dependency; fall back to hashlib.blake2b
+    xxhash = None
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('multi_agent_framework.log'),
-            logging.StreamHandler()
-        ]
-    )
+    """Set up logging configuration.
+
+    Records are handed to a QueueHandler and written to the file and console
+    by a background QueueListener, so logging calls never block on disk I/O.
+    """
+    global _log_listener
+    if _log_listener is None:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('multi_agent_framework.log')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+        # Only merge args into the message here; the listener applies the full format
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+        logging.basicConfig(
+            level=getattr(logging, log_level.upper()),
+            handlers=[queue_handler]
+        )
     return logging.getLogger(__name__)
 
+_ENSURED_DIRS: set = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
+
 def ensure_directory(path: str) -> None:
-    """Ensure directory exists, create if it doesn't."""
-    Path(path).mkdir(parents=True, exist_ok=True)
+    """Ensure directory exists, create if it doesn't.
+
+    Directories created during this process are remembered, so repeated calls
+    for the same path skip the filesystem entirely.
+    """
+    if not path or path in _ENSURED_DIRS:
+        return
+    with _ENSURED_DIRS_LOCK:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 def save_json(data: Dict[Any, Any], filepath: str) -> None:
     """Save data as JSON file."""
@@ -63,7 +107,6 @@ def validate_requirements(requirements: Dict[str, Any]) -> bool:
 
 def extract_code_blocks(text: str, language: str = "python") -> List[str]:
     """Extract code blocks from markdown text."""
-    import re
     pattern = f"```{language}\\n(.*?)\\n```"
     matches = re.findall(pattern, text, re.DOTALL)
     return matches
@@ -86,34 +129,55 @@ def create_project_structure(base_path: str, project_name: str) -> Dict[str, str
         'scripts': os.path.join(project_path, 'scripts'),
     }
     
-    for dir_path in directories.values():
-        ensure_directory(dir_path)
+    # Only create the leaf directories; parents=True creates the project root
+    for name, dir_path in directories.items():
+        if name != 'root':
+            ensure_directory(dir_path)
+    _ENSURED_DIRS.add(project_path)
     
     return directories
 
+def cache_key(text: str) -> str:
+    """Compute a fast, non-cryptographic cache key for a string."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(text)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+_FILENAME_TRANSLATION = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters."""
-    import re
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove multiple underscores
-    filename = re.sub(r'_+', '_', filename)
+    # Replace invalid characters
+    filename = filename.translate(_FILENAME_TRANSLATION)
+    # Collapse multiple underscores
+    filename = _MULTI_UNDERSCORE_RE.sub('_', filename)
     # Remove leading/trailing underscores
-    filename = filename.strip('_')
-    return filename
+    return filename.strip('_')
 
 class ProgressTracker:
     """Enhanced progress tracker with real-time updates and detailed monitoring."""
     
+    # Step progress updates notify callbacks at most this often (seconds),
+    # unless progress crosses into a new PROGRESS_BUCKET-percent bucket
+    CALLBACK_MIN_INTERVAL = 0.25
+    PROGRESS_BUCKET = 5
+    # Log entries kept in the ring buffer; older entries drop off automatically
+    MAX_LOGS = 100
+    
     def __init__(self):
         self.steps = []
         self.current_step = 0
         self.start_time = datetime.now()
-        self.logs = []
+        self._start_counter = time.perf_counter()
+        self.logs = deque(maxlen=self.MAX_LOGS)
         self.agent_activities = {}
         self.substeps = {}
         self.estimated_times = {}
+        self.step_start_times = {}
         self.callbacks = []
+        self._last_callback_time = 0.0
+        self._last_progress_bucket = None
     
     def add_step(self, step_name: str, description: str = "", estimated_duration: float = 30.0) -> None:
         """Add a step to track with estimated duration."""
@@ -155,8 +219,10 @@ class ProgressTracker:
     def start_step(self, step_index: int, agent_name: str = None) -> None:
         """Mark step as started with optional agent name."""
         if 0 <= step_index < len(self.steps):
+            start_time = datetime.now()
             self.steps[step_index]['status'] = 'running'
-            self.steps[step_index]['start_time'] = datetime.now().isoformat()
+            self.steps[step_index]['start_time'] = start_time.isoformat()
+            self.step_start_times[step_index] = time.perf_counter()
             self.steps[step_index]['agent_name'] = agent_name
             self.current_step = step_index
             
@@ -168,18 +234,24 @@ class ProgressTracker:
                 self.agent_activities[agent_name] = {
                     'status': 'active',
                     'current_task': self.steps[step_index]['description'],
-                    'start_time': datetime.now().isoformat()
+                    'start_time': start_time.isoformat()
                 }
             
-            self._notify_callbacks()
+            self._notify_callbacks(force=True)
     
     def update_step_progress(self, step_index: int, percentage: float, message: str = None) -> None:
         """Update progress percentage for a specific step."""
         if 0 <= step_index < len(self.steps):
             self.steps[step_index]['progress_percentage'] = min(100, max(0, percentage))
             if message:
-                self.add_log(f"Progress: {message} ({percentage:.1f}%)", "info")
-            self._notify_callbacks()
+                self.add_log(f"Progress: {message} ({percentage:.1f}%)", "info", notify=False)
+            
+            # Throttle callbacks for fine-grained progress ticks
+            bucket = (step_index, int(percentage) // self.PROGRESS_BUCKET)
+            if (bucket != self._last_progress_bucket or
+                    time.monotonic() - self._last_callback_time >= self.CALLBACK_MIN_INTERVAL):
+                self._last_progress_bucket = bucket
+                self._notify_callbacks()
     
     def complete_step(self, step_index: int, success: bool = True, message: str = None) -> None:
         """Mark step as completed with optional message."""
@@ -189,10 +261,10 @@ class ProgressTracker:
             end_time = datetime.now()
             self.steps[step_index]['end_time'] = end_time.isoformat()
             
-            if self.steps[step_index]['start_time']:
-                start_time = datetime.fromisoformat(self.steps[step_index]['start_time'])
-                duration = end_time - start_time
-                self.steps[step_index]['duration'] = duration.total_seconds()
+            # Durations come from the monotonic clock, immune to wall-clock jumps
+            start_counter = self.step_start_times.get(step_index)
+            if start_counter is not None:
+                self.steps[step_index]['duration'] = time.perf_counter() - start_counter
             
             # Log completion
             status_msg = "Completed" if success else "Failed"
@@ -206,9 +278,9 @@ class ProgressTracker:
                 self.agent_activities[agent_name]['status'] = 'completed' if success else 'failed'
                 self.agent_activities[agent_name]['end_time'] = end_time.isoformat()
             
-            self._notify_callbacks()
+            self._notify_callbacks(force=True)
     
-    def add_log(self, message: str, level: str = "info", agent_name: str = None) -> None:
+    def add_log(self, message: str, level: str = "info", agent_name: str = None, notify: bool = True) -> None:
         """Add a log entry with timestamp."""
         log_entry = {
             'timestamp': datetime.now().isoformat(),
@@ -218,11 +290,8 @@ class ProgressTracker:
         }
         self.logs.append(log_entry)
         
-        # Keep only last 100 logs to prevent memory issues
-        if len(self.logs) > 100:
-            self.logs = self.logs[-100:]
-        
-        self._notify_callbacks()
+        if notify:
+            self._notify_callbacks()
     
     def get_progress(self) -> Dict[str, Any]:
         """Get comprehensive progress status."""
@@ -242,7 +311,7 @@ class ProgressTracker:
                     overall_progress += (step_progress / total)
         
         # Calculate estimated time remaining
-        elapsed_time = (datetime.now() - self.start_time).total_seconds()
+        elapsed_time = time.perf_counter() - self._start_counter
         estimated_total_time = sum(self.estimated_times.values())
         estimated_remaining = max(0, estimated_total_time - elapsed_time)
         
@@ -263,7 +332,7 @@ class ProgressTracker:
             'elapsed_time': elapsed_time,
             'estimated_remaining_time': estimated_remaining,
             'estimated_total_time': estimated_total_time,
-            'logs': self.logs[-20:],  # Last 20 logs
+            'logs': self.get_recent_logs(20),  # Last 20 logs
             'agent_activities': self.agent_activities,
             'is_running': running > 0,
             'is_completed': completed == total and total > 0,
@@ -272,17 +341,30 @@ class ProgressTracker:
     
     def get_recent_logs(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get recent log entries."""
-        return self.logs[-count:] if self.logs else []
+        return list(islice(self.logs, max(0, len(self.logs) - count), None))
     
-    def add_progress_callback(self, callback) -> None:
-        """Add a callback function to be called on progress updates."""
-        self.callbacks.append(callback)
+    def add_progress_callback(self, callback, min_interval: float = 0.0) -> None:
+        """Add a callback function to be called at most every min_interval seconds."""
+        self.callbacks.append({
+            'callback': callback,
+            'min_interval': min_interval,
+            'last_called': float('-inf')
+        })
     
-    def _notify_callbacks(self) -> None:
-        """Notify all registered callbacks of progress updates."""
-        for callback in self.callbacks:
+    def _notify_callbacks(self, force: bool = False) -> None:
+        """Notify registered callbacks of progress updates, honouring their min_interval unless forced."""
+        now = time.monotonic()
+        self._last_callback_time = now
+        progress = None
+        for entry in self.callbacks:
+            if not force and now - entry['last_called'] < entry['min_interval']:
+                continue
+            entry['last_called'] = now
             try:
-                callback(self.get_progress())
+                # Build the snapshot once and share it across callbacks
+                if progress is None:
+                    progress = self.get_progress()
+                entry['callback'](progress)
             except Exception as e:
                 # Don't let callback errors break the progress tracking
                 pass
@@ -292,15 +374,26 @@ class ProgressTracker:
         self.steps = []
         self.current_step = 0
         self.start_time = datetime.now()
-        self.logs = []
+        self._start_counter = time.perf_counter()
+        self.logs = deque(maxlen=self.MAX_LOGS)
         self.agent_activities = {}
         self.substeps = {}
+        self.step_start_times = {}
         self.callbacks = []
+        self._last_callback_time = 0.0
+        self._last_progress_bucket = None
 
 
 class RealTimeProgressManager:
     """Manages real-time progress updates for Streamlit."""
     
+    _STATUS_ICONS = {
+        'pending': '⏳',
+        'running': '🔄',
+        'completed': '✅',
+        'failed': '❌'
+    }
+    
     def __init__(self):
         self.progress_tracker = None
         self.update_containers = {}
@@ -334,13 +427,7 @@ class RealTimeProgressManager:
     
     def _get_status_icon(self, status: str) -> str:
         """Get icon for status."""
-        icons = {
-            'pending': '⏳',
-            'running': '🔄',
-            'completed': '✅',
-            'failed': '❌'
-        }
-        return icons.get(status, '❓')
+        return self._STATUS_ICONS.get(status, '❓')
     
     def register_container(self, name: str, container_dict: Dict):
         """Register a container for updates."""
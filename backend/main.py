@@ -4,6 +4,7 @@ FastAPI backend server for the Multi-Agent Framework.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 import logging
@@ -58,6 +59,9 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress JSON responses (project results, history, logs) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include routers
 app.include_router(pipeline.router, prefix="/api/v1/pipeline", tags=["pipeline"])
 app.include_router(agents.router, prefix="/api/v1/agents", tags=["agents"])
@@ -202,5 +206,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        # Outlive the frontend's 60s idle keep-alive so pooled connections aren't cut under it
+        timeout_keep_alive=65,
         log_level="info"
     )
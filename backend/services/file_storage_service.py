@@ -2,19 +2,31 @@
 File storage service for persisting generated projects to disk.
 """
 
+import io
 import os
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import zipfile
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime
 from pathlib import Path
 
 class FileStorageService:
     """Service for managing persistent file storage of generated projects."""
     
-    def __init__(self, base_storage_path: str = "generated_projects"):
+    ARCHIVE_NAME = 'project_files.zip'
+    # Sections whose full_response is large enough to be moved into a sidecar file
+    SIDECAR_SECTIONS = ('tests', 'ui')
+    SIDECAR_MIN_SIZE = 4096
+    
+    def __init__(self, base_storage_path: str = "generated_projects", archive: Optional[bool] = None):
         self.logger = logging.getLogger(__name__)
         self.base_storage_path = Path(base_storage_path)
+        # When enabled, project files are written as one compressed archive instead of the
+        # expanded per-file layout; PROJECT_STORAGE_ARCHIVE=1 turns it on by default
+        if archive is None:
+            archive = os.getenv("PROJECT_STORAGE_ARCHIVE", "").lower() in ("1", "true", "yes")
+        self.archive = archive
         
         # Create base storage directory if it doesn't exist
         self.base_storage_path.mkdir(exist_ok=True)
@@ -41,63 +53,31 @@ class FileStorageService:
                 'generated_at': datetime.now().isoformat()
             }
             
+            # Metadata always stays on disk so projects can be found by ID
             with open(project_dir / 'project_metadata.json', 'w') as f:
                 json.dump(metadata, f, indent=2, default=str)
             
-            # Save generated code files
-            code_data = project_data.get('code', {})
-            if isinstance(code_data, dict):
-                # Handle new format with final_code
-                final_code = code_data.get('final_code', '')
-                if final_code:
-                    with open(project_dir / 'main.py', 'w') as f:
-                        f.write(final_code)
-                
-                # Save additional modules if any
-                additional_modules = code_data.get('additional_modules', [])
-                for module_name in additional_modules:
-                    # This would need to be enhanced to get actual module content
-                    pass
-            
-            # Check if we have generated_files in the old format
-            if 'generated_files' in project_data:
-                generated_files = project_data['generated_files']
-                if isinstance(generated_files, dict):
-                    for filename, content in generated_files.items():
-                        safe_filename = self._sanitize_filename(filename)
-                        with open(project_dir / safe_filename, 'w') as f:
-                            f.write(content)
-            
-            # Save documentation
-            docs_data = project_data.get('documentation', {})
-            if isinstance(docs_data, dict) and 'readme' in docs_data:
-                with open(project_dir / 'README.md', 'w') as f:
-                    f.write(docs_data['readme'])
-            
-            # Save tests
-            tests_data = project_data.get('tests', {})
-            if isinstance(tests_data, dict) and 'test_code' in tests_data:
-                with open(project_dir / 'test_main.py', 'w') as f:
-                    f.write(tests_data['test_code'])
-            
-            # Save deployment configuration
-            deployment_data = project_data.get('deployment', {})
-            if isinstance(deployment_data, dict) and 'deployment_configs' in deployment_data:
-                with open(project_dir / 'DEPLOYMENT.md', 'w') as f:
-                    f.write(deployment_data['deployment_configs'])
-            
-            # Save UI code
-            ui_data = project_data.get('ui', {})
-            if isinstance(ui_data, dict) and 'streamlit_app' in ui_data:
-                with open(project_dir / 'streamlit_app.py', 'w') as f:
-                    f.write(ui_data['streamlit_app'])
+            # Large agent responses are split out so the main JSON stays small and cheap to parse
+            backup_data, sidecars = self._split_sidecars(project_data)
             
-            # Save requirements.txt if we can infer dependencies
-            self._generate_requirements_file(project_dir, project_data)
+            files = self._build_file_plan(project_data)
+            files.update(sidecars)
             
-            # Save complete project data as JSON for backup
-            with open(project_dir / 'complete_project_data.json', 'w') as f:
-                json.dump(project_data, f, indent=2, default=str)
+            if self.archive:
+                # One pass into a single archive; the backup JSON is streamed into its entry
+                with zipfile.ZipFile(project_dir / self.ARCHIVE_NAME, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+                    for filename, content in files.items():
+                        archive.writestr(filename, content)
+                    with io.TextIOWrapper(archive.open('complete_project_data.json', 'w'), encoding='utf-8') as f:
+                        json.dump(backup_data, f, indent=2, default=str)
+            else:
+                for filename, content in files.items():
+                    with open(project_dir / filename, 'w') as f:
+                        f.write(content)
+                
+                # Save complete project data as JSON for backup, streamed to the file
+                with open(project_dir / 'complete_project_data.json', 'w') as f:
+                    json.dump(backup_data, f, indent=2, default=str)
             
             self.logger.info(f"Project {project_id} saved to: {project_dir.absolute()}")
             return str(project_dir.absolute())
@@ -106,6 +86,56 @@ class FileStorageService:
             self.logger.error(f"Failed to save project {project_id}: {str(e)}")
             raise
     
+    def _build_file_plan(self, project_data: Dict[str, Any]) -> Dict[str, str]:
+        """Build the mapping of generated file names to their contents for a project."""
+        files = {}
+        
+        # Save generated code files
+        code_data = project_data.get('code', {})
+        if isinstance(code_data, dict):
+            # Handle new format with final_code
+            final_code = code_data.get('final_code', '')
+            if final_code:
+                files['main.py'] = final_code
+            
+            # Save additional modules if any
+            additional_modules = code_data.get('additional_modules', [])
+            for module_name in additional_modules:
+                # This would need to be enhanced to get actual module content
+                pass
+        
+        # Check if we have generated_files in the old format
+        if 'generated_files' in project_data:
+            generated_files = project_data['generated_files']
+            if isinstance(generated_files, dict):
+                for filename, content in generated_files.items():
+                    files[self._sanitize_filename(filename)] = content
+        
+        # Save documentation
+        docs_data = project_data.get('documentation', {})
+        if isinstance(docs_data, dict) and 'readme' in docs_data:
+            files['README.md'] = docs_data['readme']
+        
+        # Save tests
+        tests_data = project_data.get('tests', {})
+        if isinstance(tests_data, dict) and 'test_code' in tests_data:
+            files['test_main.py'] = tests_data['test_code']
+        
+        # Save deployment configuration
+        deployment_data = project_data.get('deployment', {})
+        if isinstance(deployment_data, dict) and 'deployment_configs' in deployment_data:
+            files['DEPLOYMENT.md'] = deployment_data['deployment_configs']
+        
+        # Save UI code
+        ui_data = project_data.get('ui', {})
+        if isinstance(ui_data, dict) and 'streamlit_app' in ui_data:
+            files['streamlit_app.py'] = ui_data['streamlit_app']
+        
+        # Save requirements.txt if we can infer dependencies
+        files['requirements.txt'] = self._generate_requirements_file(project_data)
+        
+        return files
+    
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem compatibility."""
         # Remove or replace invalid characters
@@ -122,8 +152,40 @@ class FileStorageService:
         
         return filename
     
-    def _generate_requirements_file(self, project_dir: Path, project_data: Dict[str, Any]):
-        """Generate a requirements.txt file based on project content."""
+    def _split_sidecars(self, project_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Replace large full_response fields with references to sidecar files."""
+        sidecars = {}
+        for section in self.SIDECAR_SECTIONS:
+            section_data = project_data.get(section)
+            if not isinstance(section_data, dict):
+                continue
+            full_response = section_data.get('full_response')
+            if isinstance(full_response, str) and len(full_response) >= self.SIDECAR_MIN_SIZE:
+                filename = f'full_response_{section}.txt'
+                sidecars[filename] = full_response
+                if len(sidecars) == 1:
+                    # Shallow copy so the caller's data is left untouched
+                    project_data = dict(project_data)
+                project_data[section] = {**section_data, 'full_response': {'$ref': filename}}
+        return project_data, sidecars
+    
+    def _resolve_sidecars(self, project_data: Dict[str, Any], read_file: Callable[[str], str]) -> Dict[str, Any]:
+        """Inline sidecar file references back into project data."""
+        for section in self.SIDECAR_SECTIONS:
+            section_data = project_data.get(section)
+            if not isinstance(section_data, dict):
+                continue
+            full_response = section_data.get('full_response')
+            if isinstance(full_response, dict) and '$ref' in full_response:
+                try:
+                    section_data['full_response'] = read_file(full_response['$ref'])
+                except (OSError, KeyError) as e:
+                    self.logger.warning(f"Missing sidecar {full_response['$ref']}: {str(e)}")
+                    section_data['full_response'] = ''
+        return project_data
+    
+    def _generate_requirements_file(self, project_data: Dict[str, Any]) -> str:
+        """Generate requirements.txt content based on project content."""
         requirements = set()
         
         # Check code content for common imports
@@ -174,18 +236,16 @@ class FileStorageService:
         
         requirements.update(basic_requirements)
         
-        # Write requirements.txt
         if requirements:
-            with open(project_dir / 'requirements.txt', 'w') as f:
-                for req in sorted(requirements):
-                    f.write(f"{req}\n")
-        else:
-            # Create empty requirements.txt with comment
-            with open(project_dir / 'requirements.txt', 'w') as f:
-                f.write("# Add your project dependencies here\n")
-                f.write("# Example:\n")
-                f.write("# requests>=2.25.1\n")
-                f.write("# pandas>=1.3.0\n")
+            return "".join(f"{req}\n" for req in sorted(requirements))
+        
+        # Empty requirements.txt with comment
+        return (
+            "# Add your project dependencies here\n"
+            "# Example:\n"
+            "# requests>=2.25.1\n"
+            "# pandas>=1.3.0\n"
+        )
     
     def load_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Load complete project data from disk."""
@@ -196,12 +256,20 @@ class FileStorageService:
             
             project_dir = Path(project_path)
             complete_data_file = project_dir / 'complete_project_data.json'
+            archive_file = project_dir / self.ARCHIVE_NAME
             
             if complete_data_file.exists():
                 with open(complete_data_file, 'r') as f:
                     project_data = json.load(f)
-                    self.logger.info(f"Loaded complete project data for {project_id} from {complete_data_file}")
-                    return project_data
+                project_data = self._resolve_sidecars(project_data, lambda name: (project_dir / name).read_text())
+                self.logger.info(f"Loaded complete project data for {project_id} from {complete_data_file}")
+                return project_data
+            elif archive_file.exists():
+                with zipfile.ZipFile(archive_file) as archive:
+                    project_data = json.loads(archive.read('complete_project_data.json'))
+                    project_data = self._resolve_sidecars(project_data, lambda name: archive.read(name).decode('utf-8'))
+                self.logger.info(f"Loaded complete project data for {project_id} from {archive_file}")
+                return project_data
             else:
                 # Fallback: reconstruct from individual files
                 self.logger.info(f"Reconstructing project data for {project_id} from individual files")
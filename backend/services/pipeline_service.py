@@ -13,6 +13,18 @@ from core.agent_manager_v2 import agent_manager_v2
 from models.schemas import ProjectMetadata, ProjectStatus, ProgressUpdate
 from models.responses import GenerationResponse, ProjectResult, ValidationResponse
 from .file_storage_service import FileStorageService
+from .progress_service import PIPELINE_STEPS
+
+# Agent key and simulated duration (seconds) for each entry in PIPELINE_STEPS
+SIMULATED_STEP_AGENTS = (
+    ('requirement_analyst', 2),
+    ('python_coder', 3),
+    ('code_reviewer', 2),
+    ('documentation_writer', 2),
+    ('test_generator', 2),
+    ('deployment_engineer', 1),
+    ('ui_designer', 2),
+)
 
 class PipelineService:
     """Service for managing pipeline execution."""
@@ -146,13 +158,8 @@ class PipelineService:
         try:
             # Initialize progress tracking with proper step structure
             initial_steps = [
-                {'name': 'Requirements Analysis', 'description': 'Analyzing requirements from user input', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'Requirement Analyst'},
-                {'name': 'Code Generation', 'description': 'Generating Python code from requirements', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'Python Coder'},
-                {'name': 'Code Review', 'description': 'Reviewing code for quality and security', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'Code Reviewer'},
-                {'name': 'Documentation', 'description': 'Creating comprehensive documentation', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'Documentation Writer'},
-                {'name': 'Test Generation', 'description': 'Generating test cases', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'Test Generator'},
-                {'name': 'Deployment Config', 'description': 'Creating deployment configurations', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'Deployment Engineer'},
-                {'name': 'UI Generation', 'description': 'Creating Streamlit user interface', 'status': 'pending', 'progress_percentage': 0, 'agent_name': 'UI Designer'}
+                {'name': name, 'description': description, 'status': 'pending', 'progress_percentage': 0, 'agent_name': agent_name}
+                for name, description, agent_name in PIPELINE_STEPS
             ]
             
             self.progress_service.update_project_progress(project_id, {
@@ -255,13 +262,8 @@ class PipelineService:
             
             # Simulate step-by-step execution with proper progress updates
             steps = [
-                {'name': 'Requirements Analysis', 'agent': 'requirement_analyst', 'duration': 2},
-                {'name': 'Code Generation', 'agent': 'python_coder', 'duration': 3},
-                {'name': 'Code Review', 'agent': 'code_reviewer', 'duration': 2},
-                {'name': 'Documentation', 'agent': 'documentation_writer', 'duration': 2},
-                {'name': 'Test Generation', 'agent': 'test_generator', 'duration': 2},
-                {'name': 'Deployment Config', 'agent': 'deployment_engineer', 'duration': 1},
-                {'name': 'UI Generation', 'agent': 'ui_designer', 'duration': 2}
+                {'name': name, 'agent': agent, 'duration': duration}
+                for (name, _, _), (agent, duration) in zip(PIPELINE_STEPS, SIMULATED_STEP_AGENTS)
             ]
             
             # Execute each step with progress updates
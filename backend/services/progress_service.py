@@ -9,6 +9,24 @@ from datetime import datetime
 from models.schemas import ProjectMetadata, LogEntry, LogLevel
 from models.responses import ProgressResponse, StepInfo, ProjectResult
 
+# Standard pipeline steps as (name, description, agent_name)
+PIPELINE_STEPS = (
+    ('Requirements Analysis', 'Analyzing requirements from user input', 'Requirement Analyst'),
+    ('Code Generation', 'Generating Python code from requirements', 'Python Coder'),
+    ('Code Review', 'Reviewing code for quality and security', 'Code Reviewer'),
+    ('Documentation', 'Creating comprehensive documentation', 'Documentation Writer'),
+    ('Test Generation', 'Generating test cases', 'Test Generator'),
+    ('Deployment Config', 'Creating deployment configurations', 'Deployment Engineer'),
+    ('UI Generation', 'Creating Streamlit user interface', 'UI Designer'),
+)
+
+def _completed_steps() -> List[Dict[str, Any]]:
+    """Build the step list for a fully completed pipeline."""
+    return [
+        {'name': name, 'description': description, 'status': 'completed', 'progress_percentage': 100, 'agent_name': agent_name}
+        for name, description, agent_name in PIPELINE_STEPS
+    ]
+
 class ProgressService:
     """Service for managing progress tracking."""
     
@@ -36,7 +54,8 @@ class ProgressService:
                 'logs': []
             },
             'created_at': datetime.now(),
-            'updated_at': datetime.now()
+            'updated_at': datetime.now(),
+            'seq': 0
         }
         
         self.logger.info(f"Created progress tracking for project {project_id}")
@@ -137,7 +156,10 @@ class ProgressService:
         if len(logs) > 100:
             logs[:] = logs[-100:]
         
-        self.project_progress[project_id]['updated_at'] = datetime.now()
+        # Every progress change records a log entry, so this doubles as the change sequence
+        project_data = self.project_progress[project_id]
+        project_data['updated_at'] = datetime.now()
+        project_data['seq'] = project_data.get('seq', 0) + 1
     
     def complete_project(self, project_id: str, result: Dict[str, Any]):
         """Mark project as completed and store result with enhanced status handling."""
@@ -149,15 +171,7 @@ class ProgressService:
             overall_success = pipeline_status.get('overall_success', True)
             
             # Create completed steps array
-            completed_steps = [
-                {'name': 'Requirements Analysis', 'description': 'Analyzing requirements from user input', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Requirement Analyst'},
-                {'name': 'Code Generation', 'description': 'Generating Python code from requirements', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Python Coder'},
-                {'name': 'Code Review', 'description': 'Reviewing code for quality and security', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Code Reviewer'},
-                {'name': 'Documentation', 'description': 'Creating comprehensive documentation', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Documentation Writer'},
-                {'name': 'Test Generation', 'description': 'Generating test cases', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Test Generator'},
-                {'name': 'Deployment Config', 'description': 'Creating deployment configurations', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Deployment Engineer'},
-                {'name': 'UI Generation', 'description': 'Creating Streamlit user interface', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'UI Designer'}
-            ]
+            completed_steps = _completed_steps()
             
             # Update progress based on actual completion status
             self.project_progress[project_id]['current_progress']['is_completed'] = True
@@ -235,6 +249,11 @@ class ProgressService:
             self.logger.error(f"Error converting result data for project {project_id}: {str(e)}")
             return None
     
+    def get_progress_seq(self, project_id: str) -> int:
+        """Get the change sequence number for a project's progress."""
+        project_data = self.project_progress.get(project_id)
+        return project_data.get('seq', 0) if project_data else 0
+    
     def get_recent_logs(self, project_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent log entries for a project."""
         if project_id not in self.project_progress:
@@ -338,15 +357,7 @@ class ProgressService:
                                 )
                                 
                                 # Create completed progress data
-                                completed_steps = [
-                                    {'name': 'Requirements Analysis', 'description': 'Analyzing requirements from user input', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Requirement Analyst'},
-                                    {'name': 'Code Generation', 'description': 'Generating Python code from requirements', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Python Coder'},
-                                    {'name': 'Code Review', 'description': 'Reviewing code for quality and security', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Code Reviewer'},
-                                    {'name': 'Documentation', 'description': 'Creating comprehensive documentation', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Documentation Writer'},
-                                    {'name': 'Test Generation', 'description': 'Generating test cases', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Test Generator'},
-                                    {'name': 'Deployment Config', 'description': 'Creating deployment configurations', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'Deployment Engineer'},
-                                    {'name': 'UI Generation', 'description': 'Creating Streamlit user interface', 'status': 'completed', 'progress_percentage': 100, 'agent_name': 'UI Designer'}
-                                ]
+                                completed_steps = _completed_steps()
                                 
                                 # Reconstruct progress data
                                 self.project_progress[project_id] = {
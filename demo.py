@@ -6,67 +6,86 @@ import sys
 import os
 import asyncio
 
-# Add backend directory to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+# Add backend directory to Python path (once, ahead of site-packages)
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), 'backend')
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
 
 from services.pipeline_service import PipelineService
 
+def emit(*lines):
+    """Write a block of lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 async def run_demo():
     """Run a simple demo of the framework."""
-    print("🤖 Multi-Agent Framework Demo")
-    print("=" * 50)
-    
     # Simple demo input
     demo_input = "Create a simple calculator that can perform basic arithmetic operations (addition, subtraction, multiplication, division) with a command-line interface."
     
-    print(f"Demo Input: {demo_input}")
-    print("\nValidating input...")
+    emit(
+        "🤖 Multi-Agent Framework Demo",
+        "=" * 50,
+        f"Demo Input: {demo_input}",
+        "\nValidating input..."
+    )
     
     # Initialize pipeline service
     pipeline_service = PipelineService()
     
     try:
-        # Validate input
-        validation = await pipeline_service.validate_input(demo_input)
-        print(f"✅ Input validation passed: {validation.is_valid}")
+        # The three queries are independent, so run them concurrently
+        validation, pipeline_status, agent_info = await asyncio.gather(
+            pipeline_service.validate_input(demo_input),
+            pipeline_service.get_pipeline_status(),
+            pipeline_service.get_agent_info()
+        )
+        
+        # Report input validation
+        lines = [f"✅ Input validation passed: {validation.is_valid}"]
         
         if validation.warnings:
-            print("Warnings:")
-            for warning in validation.warnings:
-                print(f"  - {warning}")
+            lines.append("Warnings:")
+            lines.extend(f"  - {warning}" for warning in validation.warnings)
         
         if validation.suggestions:
-            print("Suggestions:")
-            for suggestion in validation.suggestions:
-                print(f"  - {suggestion}")
+            lines.append("Suggestions:")
+            lines.extend(f"  - {suggestion}" for suggestion in validation.suggestions)
+        
+        # Report pipeline status
+        lines.extend([
+            "\n📊 Pipeline Status:",
+            f"  - Agent Manager: {pipeline_status['current_progress']['agent_manager']}",
+            f"  - Available Agents: {pipeline_status['current_progress']['available_agents']}",
+            f"  - Pipeline Config: {pipeline_status['current_progress']['pipeline_config']}",
+            f"  - Total Runs: {pipeline_status['total_runs']}",
+            f"  - Successful Runs: {pipeline_status['successful_runs']}"
+        ])
         
-        # Get pipeline status
-        pipeline_status = await pipeline_service.get_pipeline_status()
-        print(f"\n📊 Pipeline Status:")
-        print(f"  - Agent Manager: {pipeline_status['current_progress']['agent_manager']}")
-        print(f"  - Available Agents: {pipeline_status['current_progress']['available_agents']}")
-        print(f"  - Pipeline Config: {pipeline_status['current_progress']['pipeline_config']}")
-        print(f"  - Total Runs: {pipeline_status['total_runs']}")
-        print(f"  - Successful Runs: {pipeline_status['successful_runs']}")
+        # Report agent info
+        lines.extend([
+            "\n🤖 Agent Information:",
+            f"  - Agent Manager Version: {agent_info['agent_manager']}",
+            f"  - Total Agents: {agent_info['total_agents']}",
+            f"  - Status: {agent_info['status']}"
+        ])
         
-        # Get agent info
-        agent_info = await pipeline_service.get_agent_info()
-        print(f"\n🤖 Agent Information:")
-        print(f"  - Agent Manager Version: {agent_info['agent_manager']}")
-        print(f"  - Total Agents: {agent_info['total_agents']}")
-        print(f"  - Status: {agent_info['status']}")
+        emit(*lines)
         
     except Exception as e:
-        print(f"❌ Error during demo: {str(e)}")
-        print("This might indicate the framework needs to be properly initialized.")
+        emit(
+            f"❌ Error during demo: {str(e)}",
+            "This might indicate the framework needs to be properly initialized."
+        )
     
-    print("\n🎯 Framework is ready for full pipeline execution!")
-    print("\nTo run the complete pipeline:")
-    print("1. Start the backend: python start_backend.py")
-    print("2. Start the frontend: python start_frontend.py")
-    print("3. Open your browser to the Streamlit interface")
-    print("\nOr use the API directly:")
-    print(f'curl -X POST "http://localhost:8000/api/v1/pipeline/generate" -H "Content-Type: application/json" -d \'{{"user_input": "{demo_input}"}}\'')
+    emit(
+        "\n🎯 Framework is ready for full pipeline execution!",
+        "\nTo run the complete pipeline:",
+        "1. Start the backend: python start_backend.py",
+        "2. Start the frontend: python start_frontend.py",
+        "3. Open your browser to the Streamlit interface",
+        "\nOr use the API directly:",
+        f'curl -X POST "http://localhost:8000/api/v1/pipeline/generate" -H "Content-Type: application/json" -d \'{{"user_input": "{demo_input}"}}\''
+    )
 
 def main():
     """Main function to run the demo."""
@@ -3,71 +3,118 @@
 Fix progress tracking for completed projects that show as "Waiting"
 """
 
-import requests
-import json
+import asyncio
+import httpx
 import os
-from pathlib import Path
+import zipfile
 
-def fix_completed_projects():
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional dependency; fall back to the stdlib parser
+    from json import loads as json_loads
+
+BACKEND_URL = "http://localhost:8000"
+# Written instead of the expanded files when the backend runs with PROJECT_STORAGE_ARCHIVE=1
+ARCHIVE_NAME = "project_files.zip"
+
+def has_main_module(project_dir: str) -> bool:
+    """Check for a generated main.py in either the expanded or the archived layout."""
+    if os.path.exists(os.path.join(project_dir, "main.py")):
+        return True
+    archive_file = os.path.join(project_dir, ARCHIVE_NAME)
+    if not os.path.exists(archive_file):
+        return False
+    with zipfile.ZipFile(archive_file) as archive:
+        return "main.py" in archive.namelist()
+
+async def check_project(client: httpx.AsyncClient, project_id: str, project_name: str, has_main: bool) -> list:
+    """Check a single project's progress and return the report lines for it."""
+    lines = [f"\nChecking project: {project_name} ({project_id})"]
+
+    # Check current progress
+    try:
+        response = await client.get(f"/api/v1/progress/{project_id}")
+        if response.status_code == 200:
+            progress = response.json()
+            is_completed = progress.get('is_completed', False)
+            progress_pct = progress.get('progress_percentage', 0)
+
+            lines.append(f"  Current status: {progress_pct}% complete, is_completed: {is_completed}")
+
+            # If project has files but progress shows incomplete, fix it
+            if not is_completed and has_main:
+                lines.append(f"  🔧 Fixing progress for completed project {project_name}")
+
+                # Call a special endpoint to mark as completed
+                # Since we don't have this endpoint, we'll simulate completion
+                # by calling the result endpoint which should trigger completion
+                result_response = await client.get(f"/api/v1/pipeline/result/{project_id}")
+                if result_response.status_code == 404:
+                    lines.append(f"  ⚠️  No result found, project may need manual completion")
+                else:
+                    lines.append(f"  ✅ Project result available")
+            else:
+                lines.append(f"  ✅ Project progress is correct")
+        else:
+            lines.append(f"  ❌ Could not get progress: {response.status_code}")
+    except Exception as e:
+        lines.append(f"  ❌ Error checking progress: {str(e)}")
+
+    return lines
+
+async def fix_completed_projects():
     """Fix progress tracking for projects that have completed but show incorrect status."""
-    
+
     # Check if generated_projects directory exists
-    projects_dir = Path("backend/generated_projects")
-    if not projects_dir.exists():
+    projects_dir = os.path.join("backend", "generated_projects")
+    if not os.path.isdir(projects_dir):
         print("No generated_projects directory found")
         return
-    
-    # Get all project directories
-    project_dirs = [d for d in projects_dir.iterdir() if d.is_dir()]
-    
+
+    # Get all project directories (scandir reuses the cached entry type)
+    with os.scandir(projects_dir) as entries:
+        project_dirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+
     print(f"Found {len(project_dirs)} project directories")
-    
+
+    # Collect projects to check from their metadata
+    projects = []
     for project_dir in project_dirs:
-        metadata_file = project_dir / "project_metadata.json"
-        if metadata_file.exists():
+        metadata_file = os.path.join(project_dir, "project_metadata.json")
+        if os.path.exists(metadata_file):
             try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                
+                with open(metadata_file, 'rb') as f:
+                    metadata = json_loads(f.read())
+
                 project_id = metadata.get('project_id')
-                project_name = metadata.get('project_name')
-                
                 if project_id:
-                    print(f"\nChecking project: {project_name} ({project_id})")
-                    
-                    # Check current progress
-                    try:
-                        response = requests.get(f"http://localhost:8000/api/v1/progress/{project_id}")
-                        if response.status_code == 200:
-                            progress = response.json()
-                            is_completed = progress.get('is_completed', False)
-                            progress_pct = progress.get('progress_percentage', 0)
-                            
-                            print(f"  Current status: {progress_pct}% complete, is_completed: {is_completed}")
-                            
-                            # If project has files but progress shows incomplete, fix it
-                            if not is_completed and (project_dir / "main.py").exists():
-                                print(f"  🔧 Fixing progress for completed project {project_name}")
-                                
-                                # Call a special endpoint to mark as completed
-                                # Since we don't have this endpoint, we'll simulate completion
-                                # by calling the result endpoint which should trigger completion
-                                result_response = requests.get(f"http://localhost:8000/api/v1/pipeline/result/{project_id}")
-                                if result_response.status_code == 404:
-                                    print(f"  ⚠️  No result found, project may need manual completion")
-                                else:
-                                    print(f"  ✅ Project result available")
-                            else:
-                                print(f"  ✅ Project progress is correct")
-                        else:
-                            print(f"  ❌ Could not get progress: {response.status_code}")
-                    except Exception as e:
-                        print(f"  ❌ Error checking progress: {str(e)}")
-                        
+                    has_main = has_main_module(project_dir)
+                    projects.append((project_id, metadata.get('project_name'), has_main))
+
             except Exception as e:
                 print(f"Error reading metadata for {project_dir}: {str(e)}")
 
+    # Check all projects concurrently; report in directory order
+    # One pooled keep-alive client for every request; transport retries
+    # cover transient connection failures
+    async with httpx.AsyncClient(
+        base_url=BACKEND_URL,
+        timeout=5.0,
+        # httpx ignores client-level limits when a transport is given, so the pool is sized here
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+    ) as client:
+        reports = await asyncio.gather(*[
+            check_project(client, project_id, project_name, has_main)
+            for project_id, project_name, has_main in projects
+        ])
+
+    for lines in reports:
+        print("\n".join(lines))
+
 if __name__ == "__main__":
     print("🔧 Fixing completed projects progress tracking...")
-    fix_completed_projects()
+    asyncio.run(fix_completed_projects())
     print("\n✅ Done!")
@@ -2,109 +2,358 @@
 HTTP API client for communicating with the FastAPI backend.
 """
 
+import asyncio
+import itertools
+import uuid
 import httpx
 import logging
+import os
+import random
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 import streamlit as st
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional dependency; fall back to the stdlib parser
+    from json import loads as json_loads
+
+try:
+    import h2  # httpx needs h2 installed before it can negotiate HTTP/2
+except ImportError:  # Optional dependency; stay on HTTP/1.1
+    h2 = None
+
+# Timeouts are immutable, so they are built once and shared by every client
+# Standard timeout for regular operations
+TIMEOUT_STD = httpx.Timeout(30.0, connect=10.0, read=30.0, write=10.0)
+# Extended timeout for long-running operations like UI generation
+TIMEOUT_LONG = httpx.Timeout(120.0, connect=15.0, read=120.0, write=30.0)
+TIMEOUT_ASYNC = httpx.Timeout(30.0, connect=5.0)
+# Progress stream: the server sends at least one event every 15 seconds
+TIMEOUT_STREAM = httpx.Timeout(30.0, connect=5.0, read=45.0)
+
+@lru_cache(maxsize=16)
+def _longpoll_timeout(wait: float) -> httpx.Timeout:
+    """Timeout for a long-poll that the server may hold for `wait` seconds."""
+    return httpx.Timeout(wait + 10.0, connect=5.0)
+
+@lru_cache(maxsize=512)
+def _project_path(template: str, project_id: str) -> str:
+    """Fill a per-project path template; cached so repeated polls reuse the same string."""
+    return template.format(project_id=project_id)
+
 class APIClient:
     """HTTP client for backend API communication."""
     
+    # Per-project path templates, filled through _project_path
+    P_PROGRESS = "/api/v1/progress/{project_id}"
+    P_LONGPOLL = "/api/v1/progress/{project_id}/longpoll"
+    P_STREAM = "/api/v1/progress/{project_id}/stream"
+    P_TEST_PROGRESS = "/api/v1/progress/test/{project_id}"
+    P_RESULT = "/api/v1/pipeline/result/{project_id}"
+    P_CANCEL = "/api/v1/pipeline/cancel/{project_id}"
+    
+    # History entries fetched for the dashboard; the page paginates them locally
+    HISTORY_LIMIT = 100
+    # Independent read-only endpoints fetched together: name -> (path, params)
+    DASHBOARD_ENDPOINTS = {
+        'agents_info': ("/api/v1/agents/info", None),
+        'pipeline_status': ("/api/v1/pipeline/status", None),
+        'statistics': ("/api/v1/projects/statistics", None),
+        'recent_projects': ("/api/v1/projects/recent", {"limit": 10}),
+        'history': ("/api/v1/projects/history", {"limit": HISTORY_LIMIT, "offset": 0, "input_preview": 200})
+    }
+    
+    # Background health probe cadence (seconds): re-check failures sooner
+    HEALTH_INTERVAL_OK = 5.0
+    HEALTH_INTERVAL_FAIL = 2.0
+    HEALTH_PROBE_RETRIES = 2
+    FIRST_PROBE_TIMEOUT = 10.0
+    MAX_RETRY_DELAY = 4.0
+    # Remember "no result yet" (404) answers briefly so polling loops don't re-ask
+    NEGATIVE_CACHE_TTL = 3.0
+    NEGATIVE_CACHE_SIZE = 1024
+    # Most recently used ETag-revalidated responses kept (one per URL, including per-project progress)
+    ETAG_CACHE_SIZE = 256
+    # Identical st.error messages are shown at most once per window (seconds), per browser session
+    UI_ERROR_DEBOUNCE = 10.0
+    UI_ERROR_STATE_KEY = "_api_ui_errors"
+    # Transient failures that are safe to retry for idempotent requests
+    RETRY_ON = (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+    
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.logger = logging.getLogger(__name__)
         self._connection_status = None
-        self._last_health_check = 0
-        
-    def _get_client(self, extended_timeout: bool = False) -> httpx.Client:
-        """Get HTTP client with timeout configuration."""
-        if extended_timeout:
-            # Extended timeout for long-running operations like UI generation
-            timeout = httpx.Timeout(120.0, connect=15.0, read=120.0, write=30.0)
-        else:
-            # Standard timeout for regular operations
-            timeout = httpx.Timeout(30.0, connect=10.0, read=30.0, write=10.0)
+        self._last_health_check = 0.0  # time.monotonic() of the last probe
+        self._health_probed = threading.Event()
+        self._health_wakeup = threading.Event()
+        self._health_stop = threading.Event()
+        self._etag_cache: "OrderedDict[str, tuple]" = OrderedDict()  # url -> (etag, raw body)
+        self._neg_cache: "OrderedDict[str, float]" = OrderedDict()  # project_id -> expiry (monotonic)
         
-        return httpx.Client(
+        # Persistent clients keep connections alive across calls and polls.
+        # HTTP/2 multiplexes concurrent requests over one connection when the
+        # server negotiates it; otherwise httpx stays on HTTP/1.1.
+        # Keep idle connections for a minute so reruns after a pause skip the handshake
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0)
+        http2 = h2 is not None
+        # httpx advertises only the encodings it can decode (gzip/deflate, plus br
+        # when brotli is installed) and decompresses responses transparently
+        headers = {"User-Agent": "multiagent-frontend/1.0"}
+        # Every request is tagged with an X-Request-ID for backend log correlation
+        self._session_id = uuid.uuid4().hex[:12]
+        self._request_counter = itertools.count(1)
+        event_hooks = {"request": [self._tag_request]}
+        # A co-located backend can be reached over a Unix socket, skipping loopback TCP
+        self._uds_path = self._local_socket_path()
+        self._client = httpx.Client(
             base_url=self.base_url,
-            timeout=timeout,
-            follow_redirects=True
+            timeout=TIMEOUT_STD,
+            follow_redirects=True,
+            limits=limits,
+            http2=http2,
+            headers=headers,
+            event_hooks=event_hooks,
+            **self._uds_transport_options(limits, http2)
         )
+        self._client_long = httpx.Client(
+            base_url=self.base_url,
+            timeout=TIMEOUT_LONG,
+            follow_redirects=True,
+            limits=limits,
+            http2=http2,
+            headers=headers,
+            event_hooks=event_hooks,
+            **self._uds_transport_options(limits, http2)
+        )
+        
+        # Health probes run off the Streamlit script thread; the thread holds only
+        # a weak reference so a discarded client can still be collected.
+        # Its first probe also opens a connection in the standard pool.
+        threading.Thread(
+            target=self._health_loop,
+            args=(weakref.ref(self),),
+            name="api-health-check",
+            daemon=True
+        ).start()
+        # Pre-open the extended-timeout pool too, off the user-visible path
+        threading.Thread(target=self._warm_up, name="api-warm-up", daemon=True).start()
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Stop the health thread and close the underlying HTTP connection pools."""
+        self._health_stop.set()
+        self._health_wakeup.set()
+        self._client.close()
+        self._client_long.close()
+    
+    def _tag_request(self, request: httpx.Request) -> None:
+        """Attach a session-scoped, sequential X-Request-ID unless the caller set one."""
+        request.headers.setdefault("X-Request-ID", f"{self._session_id}-{next(self._request_counter)}")
+    
+    async def _tag_request_async(self, request: httpx.Request) -> None:
+        """Async event hook variant of _tag_request."""
+        self._tag_request(request)
+    
+    def _warm_up(self) -> None:
+        """Open a keep-alive connection in the extended-timeout pool."""
+        try:
+            self._client_long.get("/health")
+        except Exception as e:
+            self.logger.debug("Connection warm-up failed: %s", e)
+    
+    def _local_socket_path(self) -> Optional[str]:
+        """Get the BACKEND_UDS socket path if the backend is local and the socket exists."""
+        uds_path = os.environ.get("BACKEND_UDS")
+        if not uds_path or httpx.URL(self.base_url).host not in ("localhost", "127.0.0.1"):
+            return None
+        if not os.path.exists(uds_path):
+            self.logger.info("BACKEND_UDS socket %s not found, using TCP", uds_path)
+            return None
+        return uds_path
+    
+    def _uds_transport_options(self, limits: httpx.Limits, http2: bool) -> Dict[str, Any]:
+        """Client kwargs for the Unix socket transport, if one is in use.
+        
+        httpx ignores the client's limits and http2 arguments when a transport
+        is passed, so the pool tuning is applied to the transport itself.
+        """
+        if not self._uds_path:
+            return {}
+        return {"transport": httpx.HTTPTransport(uds=self._uds_path, limits=limits, http2=http2)}
+    
+    def _show_error(self, message: str) -> None:
+        """Show an error in the UI unless the same message was shown within UI_ERROR_DEBOUNCE."""
+        # The client is shared across sessions, so the timestamps live in session state
+        shown = st.session_state.setdefault(self.UI_ERROR_STATE_KEY, {})  # message -> last shown (monotonic)
+        now = time.monotonic()
+        if now - shown.get(message, float('-inf')) < self.UI_ERROR_DEBOUNCE:
+            return
+        shown[message] = now
+        st.error(message)
+    
+    def _get_client(self, extended_timeout: bool = False) -> httpx.Client:
+        """Get the shared HTTP client for the requested timeout profile."""
+        return self._client_long if extended_timeout else self._client
     
     async def _get_async_client(self) -> httpx.AsyncClient:
         """Get async HTTP client with timeout configuration."""
         return httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=httpx.Timeout(30.0, connect=5.0)
+            timeout=TIMEOUT_ASYNC,
+            http2=h2 is not None,
+            event_hooks={"request": [self._tag_request_async]},
+            transport=httpx.AsyncHTTPTransport(uds=self._uds_path, http2=h2 is not None) if self._uds_path else None
         )
     
-    def health_check(self, max_retries: int = 3, retry_delay: float = 1.0) -> bool:
-        """Check if the backend is healthy with retry logic."""
-        current_time = time.time()
-        
-        # Use cached result if recent (within 5 seconds)
-        if (self._connection_status is not None and 
-            current_time - self._last_health_check < 5.0):
-            return self._connection_status
-        
+    async def _fetch_json(self, client: httpx.AsyncClient, name: str) -> Optional[Dict[str, Any]]:
+        """Fetch one dashboard endpoint, returning None on failure."""
+        path, params = self.DASHBOARD_ENDPOINTS[name]
+        try:
+            response = await client.get(path, params=params)
+            response.raise_for_status()
+            return self._json(response)
+        except Exception as e:
+            self.logger.error("Failed to get %s: %s", name, e)
+            return None
+    
+    async def fetch_dashboard(self, *names: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch the named dashboard endpoints (all by default) concurrently."""
+        names = names or tuple(self.DASHBOARD_ENDPOINTS)
+        # The async client is tied to the running event loop, so it lives per call
+        async with await self._get_async_client() as client:
+            results = await asyncio.gather(*(self._fetch_json(client, name) for name in names))
+        return dict(zip(names, results))
+    
+    def get_dashboard(self, *names: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Synchronous wrapper around fetch_dashboard for the Streamlit script thread."""
+        return asyncio.run(self.fetch_dashboard(*names))
+    
+    def get_dashboard_bundle(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get pipeline status, statistics and history in one request, fetching them separately if that fails."""
+        try:
+            bundle = self._get_json("/api/v1/projects/dashboard", params={"history_limit": self.HISTORY_LIMIT})
+            if bundle:
+                return bundle
+        except Exception as e:
+            self.logger.warning("Dashboard endpoint unavailable, fetching sections separately: %s", e)
+        return self.get_dashboard('pipeline_status', 'statistics', 'history')
+    
+    def health_check(self) -> bool:
+        """Return the last known backend health without blocking on the network."""
+        if self._connection_status is None:
+            # No probe has finished yet; wait briefly for the first one
+            self._health_probed.wait(self.FIRST_PROBE_TIMEOUT)
+        return bool(self._connection_status)
+    
+    def reset_caches(self) -> None:
+        """Drop cached responses and re-probe health, keeping the connection pools open."""
+        self._etag_cache.clear()
+        self._neg_cache.clear()
+        st.session_state.pop(self.UI_ERROR_STATE_KEY, None)
+        self.force_refresh()
+    
+    def force_refresh(self) -> None:
+        """Wake the background health thread for an immediate probe."""
+        self._health_probed.clear()
+        self._health_wakeup.set()
+    
+    @staticmethod
+    def _health_loop(client_ref: "weakref.ref") -> None:
+        """Probe /health periodically until the client is closed or garbage collected."""
+        while True:
+            client = client_ref()
+            if client is None or client._health_stop.is_set():
+                return
+            
+            is_ready = client._probe_health(client.HEALTH_PROBE_RETRIES, 1.0)
+            client._connection_status = is_ready
+            client._last_health_check = time.monotonic()
+            client._health_probed.set()
+            
+            wakeup = client._health_wakeup
+            interval = client.HEALTH_INTERVAL_OK if is_ready else client.HEALTH_INTERVAL_FAIL
+            # Drop the strong reference while sleeping so the client can be collected
+            del client
+            wakeup.wait(interval)
+            wakeup.clear()
+    
+    def _probe_health(self, max_retries: int, retry_delay: float) -> bool:
+        """Probe /health with retry logic."""
         for attempt in range(max_retries):
             try:
-                with self._get_client() as client:
-                    response = client.get("/health")
-                    if response.status_code == 200:
-                        # Check if response indicates services are ready
-                        try:
-                            health_data = response.json()
-                            is_ready = health_data.get('ready', True)  # Default to True for backward compatibility
-                            self._connection_status = is_ready
-                            self._last_health_check = current_time
-                            
-                            if not is_ready:
-                                self.logger.warning(f"Backend services not ready: {health_data}")
-                            
-                            return is_ready
-                        except Exception:
-                            # If we can't parse JSON, assume healthy if status is 200
-                            self._connection_status = True
-                            self._last_health_check = current_time
-                            return True
-                    else:
-                        self.logger.warning(f"Health check returned status {response.status_code}")
+                client = self._get_client()
+                response = client.get("/health")
+                self.logger.debug("Health check served over %s", response.http_version)
+                if response.status_code == 200:
+                    # Check if response indicates services are ready
+                    try:
+                        health_data = self._json(response)
+                        is_ready = health_data.get('ready', True)  # Default to True for backward compatibility
+                        
+                        if not is_ready:
+                            self.logger.warning("Backend services not ready: %s", health_data)
+                        
+                        return is_ready
+                    except Exception:
+                        # If we can't parse JSON, assume healthy if status is 200
+                        return True
+                else:
+                    self.logger.warning("Health check returned status %s", response.status_code)
                         
             except httpx.ConnectError as e:
-                self.logger.warning(f"Connection failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                self.logger.warning("Connection failed (attempt %s/%s): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                    # Exponential backoff, capped to keep the UI responsive
+                    time.sleep(min(retry_delay * (2 ** attempt), self.MAX_RETRY_DELAY))
                     
             except httpx.TimeoutException as e:
-                self.logger.warning(f"Health check timeout (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                self.logger.warning("Health check timeout (attempt %s/%s): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
                     
             except Exception as e:
-                self.logger.error(f"Health check failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                self.logger.error("Health check failed (attempt %s/%s): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
         
         # All attempts failed
-        self._connection_status = False
-        self._last_health_check = current_time
         return False
     
+    def ping(self, timeout: float = 5.0) -> int:
+        """Request the backend root on the pooled client and return the HTTP status code."""
+        return self._client.get("/", timeout=timeout).status_code
+    
     def get_detailed_health_status(self) -> Dict[str, Any]:
         """Get detailed health status from backend."""
         try:
-            with self._get_client() as client:
-                response = client.get("/health")
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "error": f"HTTP {response.status_code}",
-                        "ready": False
-                    }
+            client = self._get_client()
+            response = client.get("/health")
+            if response.status_code == 200:
+                return self._json(response)
+            else:
+                return {
+                    "status": "unhealthy",
+                    "error": f"HTTP {response.status_code}",
+                    "ready": False
+                }
         except Exception as e:
             return {
                 "status": "unreachable",
@@ -112,100 +361,95 @@ class APIClient:
                 "ready": False
             }
     
-    def generate_code(self, user_input: str, project_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Start code generation."""
-        try:
-            with self._get_client() as client:
-                payload = {
-                    "user_input": user_input,
-                    "project_name": project_name
-                }
-                response = client.post("/api/v1/pipeline/generate", json=payload)
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Code generation request failed: {str(e)}")
-            st.error(f"Failed to start code generation: {str(e)}")
-            return None
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  extended_timeout: bool = False, **kwargs) -> Any:
+        """GET a read-only resource, revalidating the cached copy with If-None-Match."""
+        client = self._get_client()
+        cache_id = str(client.build_request("GET", url, params=params).url)
+        cached = self._etag_cache.get(cache_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self._request_with_retry("GET", url, params=params, headers=headers,
+                                            extended_timeout=extended_timeout, **kwargs)
+        if response.status_code == 304 and cached:
+            # The client is shared across sessions, so each caller gets its own parsed copy
+            self._etag_cache.move_to_end(cache_id)
+            return json_loads(cached[1]) if cached[1] else None
+        
+        response.raise_for_status()
+        etag = response.headers.get("etag")
+        if etag:
+            self._etag_cache[cache_id] = (etag, response.content)
+            self._etag_cache.move_to_end(cache_id)
+            if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return self._json(response)
     
-    def validate_input(self, user_input: str) -> Optional[Dict[str, Any]]:
-        """Validate user input."""
-        try:
-            with self._get_client() as client:
-                payload = {"user_input": user_input}
-                response = client.post("/api/v1/pipeline/validate", json=payload)
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Input validation failed: {str(e)}")
-            return None
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Parse a response body with the fastest available JSON parser."""
+        return json_loads(response.content) if response.content else None
     
-    def get_pipeline_status(self) -> Optional[Dict[str, Any]]:
-        """Get overall pipeline status."""
-        try:
-            with self._get_client() as client:
-                response = client.get("/api/v1/pipeline/status")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to get pipeline status: {str(e)}")
+    def _request_with_retry(self, method: str, url: str, retries: int = 2, base: float = 0.25,
+                            cap: float = 2.0, extended_timeout: bool = False, **kwargs) -> httpx.Response:
+        """Send a request, retrying transient failures with jittered exponential backoff."""
+        # Non-idempotent requests are only retried when no connection was made
+        retry_on = self.RETRY_ON if method in ("GET", "HEAD") else (httpx.ConnectError,)
+        client = self._get_client(extended_timeout)
+        
+        for attempt in range(retries + 1):
+            try:
+                return client.request(method, url, **kwargs)
+            except retry_on as e:
+                if attempt == retries:
+                    raise
+                # Jitter spreads out clients that all failed at once (e.g. backend restart)
+                delay = min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+                self.logger.warning("%s %s failed (%s), retrying in %.2fs", method, url, e, delay)
+                time.sleep(delay)
+    
+    def _request(self, method: str, url: str, extended_timeout: bool = False, **kwargs) -> Optional[Any]:
+        """Send a request on the shared client and return the parsed JSON body, or None on an HTTP error."""
+        response = self._request_with_retry(method, url, extended_timeout=extended_timeout, **kwargs)
+        if response.status_code >= 400:
+            self.logger.error("%s %s failed with status %s", method, url, response.status_code)
             return None
+        return self._json(response) if response.content else {}
     
-    def get_project_status(self, project_id: str) -> Optional[Dict[str, Any]]:
-        """Get status for a specific project."""
+    def generate_code(self, user_input: str, project_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Start code generation."""
         try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/pipeline/status/{project_id}")
-                response.raise_for_status()
-                return response.json()
+            payload = {
+                "user_input": user_input,
+                "project_name": project_name
+            }
+            result = self._request("POST", "/api/v1/pipeline/generate", json=payload)
         except Exception as e:
-            self.logger.error(f"Failed to get project status: {str(e)}")
+            self.logger.error("Code generation request failed: %s", e)
+            self._show_error(f"Failed to start code generation: {e}")
             return None
+        if result is None:
+            self._show_error("Failed to start code generation: the backend rejected the request")
+        return result
     
     def get_project_result(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get complete project result."""
         try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/pipeline/result/{project_id}")
-                response.raise_for_status()
-                return response.json()
+            response = self._get_client().get(_project_path(self.P_RESULT, project_id))
+            response.raise_for_status()
+            return self._json(response)
         except Exception as e:
-            self.logger.error(f"Failed to get project result: {str(e)}")
+            self.logger.error("Failed to get project result: %s", e)
             return None
     
     def cancel_project(self, project_id: str) -> bool:
         """Cancel a running project."""
         try:
-            with self._get_client() as client:
-                response = client.post(f"/api/v1/pipeline/cancel/{project_id}")
-                response.raise_for_status()
-                return True
+            return self._request("POST", _project_path(self.P_CANCEL, project_id)) is not None
         except Exception as e:
-            self.logger.error(f"Failed to cancel project: {str(e)}")
+            self.logger.error("Failed to cancel project: %s", e)
             return False
     
-    def get_agents_info(self) -> Optional[Dict[str, Any]]:
-        """Get information about all agents."""
-        try:
-            with self._get_client() as client:
-                response = client.get("/api/v1/agents/info")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to get agents info: {str(e)}")
-            return None
-    
-    def get_agent_details(self, agent_name: str) -> Optional[Dict[str, Any]]:
-        """Get details for a specific agent."""
-        try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/agents/{agent_name}")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to get agent details: {str(e)}")
-            return None
-    
     def get_project_progress(self, project_id: str, extended_timeout: bool = False) -> Optional[Dict[str, Any]]:
         """Get current progress for a project with enhanced error handling."""
         max_retries = 3 if extended_timeout else 2
@@ -213,31 +457,30 @@ class APIClient:
         
         for attempt in range(max_retries):
             try:
-                with self._get_client(extended_timeout=extended_timeout) as client:
-                    response = client.get(f"/api/v1/progress/{project_id}")
-                    response.raise_for_status()
-                    return response.json()
+                # An unchanged snapshot comes back as a bodiless 304; this loop does the retrying
+                return self._get_json(_project_path(self.P_PROGRESS, project_id),
+                                      extended_timeout=extended_timeout, retries=0)
                     
             except httpx.TimeoutException as e:
-                self.logger.warning(f"Progress request timeout (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                self.logger.warning("Progress request timeout (attempt %s/%s): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
                     continue
                 else:
-                    self.logger.error(f"Progress request timed out after {max_retries} attempts")
+                    self.logger.error("Progress request timed out after %s attempts", max_retries)
                     return None
                     
             except httpx.ConnectError as e:
-                self.logger.warning(f"Progress request connection failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                self.logger.warning("Progress request connection failed (attempt %s/%s): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
                     continue
                 else:
-                    self.logger.error(f"Progress request connection failed after {max_retries} attempts")
+                    self.logger.error("Progress request connection failed after %s attempts", max_retries)
                     return None
                     
             except Exception as e:
-                self.logger.error(f"Failed to get project progress (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                self.logger.error("Failed to get project progress (attempt %s/%s): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
                     continue
@@ -246,101 +489,137 @@ class APIClient:
         
         return None
     
-    def get_project_logs(self, project_id: str, limit: int = 50) -> Optional[Dict[str, Any]]:
-        """Get logs for a project."""
+    def get_project_progress_longpoll(self, project_id: str, since_seq: int = -1, wait: float = 25.0) -> Optional[Dict[str, Any]]:
+        """Wait for progress newer than since_seq; returns {'seq': ..., 'progress': ...}."""
         try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/progress/{project_id}/logs?limit={limit}")
-                response.raise_for_status()
-                return response.json()
+            # The server holds the request for up to `wait` seconds
+            return self._request("GET", _project_path(self.P_LONGPOLL, project_id),
+                                 params={"since": since_seq, "wait": wait}, timeout=_longpoll_timeout(wait))
         except Exception as e:
-            self.logger.error(f"Failed to get project logs: {str(e)}")
+            self.logger.error("Failed to long-poll project progress: %s", e)
             return None
     
-    def get_project_history(self, limit: int = 10, offset: int = 0, filter_success: Optional[bool] = None) -> Optional[Dict[str, Any]]:
-        """Get project history."""
-        try:
-            with self._get_client() as client:
-                params = {"limit": limit, "offset": offset}
-                if filter_success is not None:
-                    params["filter_success"] = filter_success
-                
-                response = client.get("/api/v1/projects/history", params=params)
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to get project history: {str(e)}")
-            return None
-    
-    def get_project_statistics(self) -> Optional[Dict[str, Any]]:
-        """Get project statistics."""
-        try:
-            with self._get_client() as client:
-                response = client.get("/api/v1/projects/statistics")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to get project statistics: {str(e)}")
-            return None
+    def stream_project_progress(self, project_id: str, since_seq: int = -1):
+        """Yield {'seq': ..., 'progress': ...} events from the server-sent progress stream.
+        
+        Events arrive when progress changes, plus a periodic repeat of the
+        current snapshot. Connection and HTTP errors propagate to the caller.
+        """
+        # Ask for an uncompressed body: the gzip middleware buffers small frames instead of flushing them
+        with self._client_long.stream("GET", _project_path(self.P_STREAM, project_id),
+                                      params={"since": since_seq}, timeout=TIMEOUT_STREAM,
+                                      headers={"Accept-Encoding": "identity"}) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith("data:"):
+                    yield json_loads(line[5:])
     
     def search_projects(self, query: str) -> Optional[Dict[str, Any]]:
         """Search projects."""
         try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/projects/search?q={query}")
-                response.raise_for_status()
-                return response.json()
+            return self._request("GET", "/api/v1/projects/search", params={"q": query})
         except Exception as e:
-            self.logger.error(f"Failed to search projects: {str(e)}")
-            return None
-    
-    def get_recent_projects(self, limit: int = 10) -> Optional[Dict[str, Any]]:
-        """Get recent projects."""
-        try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/projects/recent?limit={limit}")
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to get recent projects: {str(e)}")
+            self.logger.error("Failed to search projects: %s", e)
             return None
     
     def test_progress_tracking(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Test progress tracking with fake data."""
         try:
-            with self._get_client() as client:
-                response = client.get(f"/api/v1/progress/test/{project_id}")
-                response.raise_for_status()
-                return response.json()
+            result = self._request("GET", _project_path(self.P_TEST_PROGRESS, project_id))
         except Exception as e:
-            self.logger.error(f"Failed to test progress tracking: {str(e)}")
-            st.error(f"Progress tracking test failed: {str(e)}")
+            self.logger.error("Failed to test progress tracking: %s", e)
+            self._show_error(f"Progress tracking test failed: {e}")
             return None
+        if result is None:
+            self._show_error("Progress tracking test failed: the backend rejected the request")
+        return result
     
     def check_project_completion_fallback(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Check if project is completed by looking for results when progress is unavailable."""
+        not_completed = {
+            'is_completed': False,
+            'has_result': False,
+            'result': None
+        }
+        if self._neg_cache.get(project_id, 0.0) > time.monotonic():
+            return not_completed
+        
         try:
-            with self._get_client() as client:
-                # Try to get project result
-                response = client.get(f"/api/v1/pipeline/result/{project_id}")
-                if response.status_code == 200:
-                    result = response.json()
-                    self.logger.info(f"Found completed project result for {project_id}")
-                    return {
-                        'is_completed': True,
-                        'has_result': True,
-                        'result': result
-                    }
-                elif response.status_code == 404:
-                    # No result found, project might not exist or failed
-                    return {
-                        'is_completed': False,
-                        'has_result': False,
-                        'result': None
-                    }
-                else:
-                    # Other error
-                    return None
+            # Try to get project result
+            response = self._get_client().get(_project_path(self.P_RESULT, project_id))
+            status_code = response.status_code
+            if status_code == 200:
+                self._neg_cache.pop(project_id, None)
+                self.logger.info("Found completed project result for %s", project_id)
+                return {
+                    'is_completed': True,
+                    'has_result': True,
+                    'result': self._json(response)
+                }
+            elif status_code == 404:
+                # No result found, project might not exist or failed
+                self._neg_cache[project_id] = time.monotonic() + self.NEGATIVE_CACHE_TTL
+                self._neg_cache.move_to_end(project_id)
+                if len(self._neg_cache) > self.NEGATIVE_CACHE_SIZE:
+                    self._neg_cache.popitem(last=False)
+                return not_completed
+            else:
+                # Other error
+                return None
         except Exception as e:
-            self.logger.error(f"Failed to check project completion fallback: {str(e)}")
+            self.logger.error("Failed to check project completion fallback: %s", e)
             return None
+
+
+# Plain request/response endpoints as (method name, HTTP method, path template,
+# query parameters with defaults, JSON body fields, revalidate with ETag, docstring).
+# Methods with custom retries, UI feedback or fallbacks are written out above.
+ENDPOINTS = (
+    ("validate_input", "POST", "/api/v1/pipeline/validate", {}, ("user_input",), False, "Validate user input."),
+    ("get_pipeline_status", "GET", "/api/v1/pipeline/status", {}, (), False, "Get overall pipeline status."),
+    ("get_project_status", "GET", "/api/v1/pipeline/status/{project_id}", {}, (), False, "Get status for a specific project."),
+    ("get_agents_info", "GET", "/api/v1/agents/info", {}, (), True, "Get information about all agents."),
+    ("get_agent_details", "GET", "/api/v1/agents/{agent_name}", {}, (), True, "Get details for a specific agent."),
+    ("get_project_logs", "GET", "/api/v1/progress/{project_id}/logs", {"limit": 50}, (), False, "Get logs for a project."),
+    ("get_project_history", "GET", "/api/v1/projects/history", {"limit": 10, "offset": 0, "filter_success": None}, (), False, "Get project history."),
+    ("get_project_statistics", "GET", "/api/v1/projects/statistics", {}, (), True, "Get project statistics."),
+    ("get_recent_projects", "GET", "/api/v1/projects/recent", {"limit": 10}, (), True, "Get recent projects."),
+)
+
+_PATH_FIELD_RE = re.compile(r'\{(\w+)\}')
+
+def _make_endpoint(name: str, http_method: str, path: str, query: Dict[str, Any],
+                   body: Tuple[str, ...], etag: bool, doc: str):
+    """Build an APIClient method for one ENDPOINTS entry."""
+    path_fields = tuple(_PATH_FIELD_RE.findall(path))
+    # Positional arguments fill path fields, then body fields, then query parameters
+    arg_names = path_fields + body + tuple(query)
+    
+    def endpoint(self, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        values = dict(query)
+        values.update(zip(arg_names, args))
+        values.update(kwargs)
+        try:
+            if not path_fields:
+                url = path
+            elif path_fields == ('project_id',):
+                url = _project_path(path, values['project_id'])
+            else:
+                url = path.format(**{field: values[field] for field in path_fields})
+            # Unset (None) query parameters are left out of the request
+            params = {key: values[key] for key in query if values[key] is not None} or None
+            if etag:
+                return self._get_json(url, params=params)
+            payload = {field: values[field] for field in body} if body else None
+            return self._request(http_method, url, params=params, json=payload)
+        except Exception as e:
+            self.logger.error("%s request failed: %s", name, e)
+            return None
+    
+    endpoint.__name__ = name
+    endpoint.__qualname__ = f"APIClient.{name}"
+    endpoint.__doc__ = doc
+    return endpoint
+
+for _spec in ENDPOINTS:
+    setattr(APIClient, _spec[0], _make_endpoint(*_spec))
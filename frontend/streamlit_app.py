@@ -3,10 +3,25 @@ Clean Streamlit frontend that communicates with FastAPI backend.
 """
 
 import streamlit as st
-import json
+import random
+import sys
 import time
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # Optional dependency; fall back to datetime.fromisoformat
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts a trailing 'Z' itself from 3.11
+        parse_datetime = datetime.fromisoformat
+    else:
+        def parse_datetime(timestamp: str) -> datetime:
+            """Parse an ISO-8601 timestamp, accepting a trailing 'Z'."""
+            if timestamp.endswith('Z'):
+                timestamp = timestamp[:-1] + '+00:00'
+            return datetime.fromisoformat(timestamp)
 
 from client.api_client import APIClient
 
@@ -18,25 +33,148 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize API client
+# Initialize API client. It is shared by every session in the process and holds the
+# keep-alive connection pool, so it is never mutated or cleared from the UI.
 @st.cache_resource
 def get_api_client():
     """Get API client instance."""
     return APIClient()
 
+api_client = get_api_client()
+
 # Add cache clearing button in sidebar for debugging
-if st.sidebar.button("🔄 Clear Cache", help="Clear API client cache if experiencing issues"):
-    st.cache_resource.clear()
+if st.sidebar.button("🔄 Clear Cache", help="Clear cached API responses if experiencing issues"):
+    st.cache_data.clear()
+    api_client.reset_caches()
     st.rerun()
 
-api_client = get_api_client()
+# Seconds the backend may hold a progress long-poll before answering unchanged
+PROGRESS_LONGPOLL_WAIT = 10.0
+# Give up on live progress after this many seconds and fall back to a completion check
+PROGRESS_DEADLINE = 300.0
+# Retry interval when no progress arrives: grows while stalled, resets on change
+PROGRESS_POLL_MIN_INTERVAL = 0.5
+PROGRESS_POLL_MAX_INTERVAL = 5.0
+
+DESCRIPTION_MD = """
+Transform your ideas into complete Python applications using our AI-powered multi-agent system.
+Simply describe what you want to build, and our specialized agents will:
+
+- 📋 Analyze your requirements
+- 💻 Generate production-ready code
+- 🔍 Review and optimize the code
+- 📚 Create comprehensive documentation
+- 🧪 Generate test cases
+- 🚀 Create deployment configurations
+- 🎨 Build a Streamlit user interface
+"""
+
+# Quick example buttons: (label, project description)
+EXAMPLES = (
+    ("📊 Data Analysis Tool", "Create a data analysis tool that reads CSV files, performs statistical analysis, generates visualizations, and exports reports in PDF format."),
+    ("🌐 Web API", "Build a REST API for a task management system with user authentication, CRUD operations for tasks, and email notifications."),
+    ("🤖 Chatbot", "Create an intelligent chatbot that can answer questions about a knowledge base, with conversation history and context awareness.")
+)
+
+# Pipeline steps in execution order, with their fixed labels rendered once
+STEP_NAMES = (
+    "Requirements Analysis",
+    "Code Generation",
+    "Code Review",
+    "Documentation",
+    "Test Generation",
+    "Deployment Config",
+    "UI Generation"
+)
+WAITING_TEMPLATES = tuple(f"⏳ **{i+1}. {name}** - Waiting" for i, name in enumerate(STEP_NAMES))
+COMPLETED_TEMPLATES = tuple(f"✅ **{i+1}. {name}** - Completed" for i, name in enumerate(STEP_NAMES))
+# Step widget by status: (placeholder method, label formatted with step number, name and progress)
+STATUS_FMT = {
+    'running': ('info', "🔄 **{n}. {name}** - Running ({p:.0f}%)"),
+    'ui_running': ('info', "🎨 **{n}. {name}** - AI Processing ({p:.0f}%)"),
+    'completed': ('success', "✅ **{n}. {name}** - Completed"),
+    'failed': ('error', "❌ **{n}. {name}** - Failed"),
+    'pending': ('info', "⏳ **{n}. {name}** - Waiting")
+}
+
+def format_iso_timestamp(timestamp: str) -> str:
+    """Format an ISO-8601 timestamp for display."""
+    # Too short to hold a date: show as-is without raising
+    if len(timestamp) < 10:
+        return timestamp
+    try:
+        return parse_datetime(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return timestamp
+
+# Project-history expanders rendered per page
+HISTORY_PAGE_SIZE = 20
+
+# One rendered project-history entry
+HistoryRow = namedtuple('HistoryRow', 'name formatted_time success_icon exec_time_str display_input error')
+
+@st.cache_data(show_spinner=False)
+def prepare_history_rows(projects: tuple) -> list:
+    """Precompute display fields for history entries given as (name, timestamp, success, execution time, input, error)."""
+    return [
+        HistoryRow(
+            project_name,
+            format_iso_timestamp(timestamp) if isinstance(timestamp, str) else (str(timestamp) if timestamp else ''),
+            '✅' if success else '❌',
+            f"{float(execution_time or 0):.2f}s",
+            user_input[:200] + "..." if len(user_input) > 200 else user_input,
+            error if not success else None
+        )
+        for project_name, timestamp, success, execution_time, user_input, error in projects
+    ]
+
+@st.cache_data(ttl=60)
+def get_agents_info_cached():
+    """Get agent information, shared by all sessions for a minute since it rarely changes."""
+    agent_info = api_client.get_agents_info()
+    # Raising keeps a failed fetch out of the cache so the next rerun retries it
+    if not agent_info:
+        raise RuntimeError("backend returned no agent information")
+    return agent_info
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def validate_input_cached(user_input: str):
+    """Validate user input, reusing the result for text that was already checked."""
+    validation = api_client.validate_input(user_input)
+    # Raising keeps a failed validation out of the cache so the next rerun retries it
+    if validation is None:
+        raise RuntimeError("backend returned no validation result")
+    return validation
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_detailed_health_cached():
+    """Get the backend's detailed health report, shared by reruns within a few seconds."""
+    return api_client.get_detailed_health_status()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def get_pipeline_status_cached():
+    """Get pipeline status, shared by reruns that land within a couple of seconds."""
+    return api_client.get_pipeline_status()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_dashboard_cached():
+    """Get pipeline status, statistics and history, reused across reruns until refreshed."""
+    dashboard = api_client.get_dashboard_bundle()
+    # Raising keeps a failed fetch out of the cache so the next rerun retries it
+    if dashboard.get('statistics') is None or dashboard.get('history') is None:
+        raise RuntimeError("backend returned no project statistics or history")
+    return dashboard
 
 def check_backend_connection():
     """Check if backend is available with detailed diagnostics."""
+    # Fast path: the client's background probe already knows the backend is ready
+    if api_client.health_check():
+        return True
+    
     with st.spinner("Checking backend connection..."):
         # Try to get detailed health status, fallback to basic health check
         try:
-            health_status = api_client.get_detailed_health_status()
+            health_status = get_detailed_health_cached()
         except AttributeError:
             # Fallback if method doesn't exist (cache issue)
             st.warning("Using fallback health check method")
@@ -45,16 +183,19 @@ def check_backend_connection():
             else:
                 health_status = {"status": "unreachable", "ready": False, "error": "Connection failed"}
         
-        if health_status.get('ready', False):
+        # Read every field once up front
+        status = health_status.get('status', 'unknown')
+        error = health_status.get('error', 'Unknown error')
+        services = health_status.get('services', {})
+        ready = health_status.get('ready', False)
+        
+        if ready:
             # Backend is healthy and ready
             return True
         
         # Backend is not ready or unreachable
         st.error("❌ **Backend Connection Issue**")
         
-        status = health_status.get('status', 'unknown')
-        error = health_status.get('error', 'Unknown error')
-        
         if status == 'unreachable':
             st.error(f"**Cannot reach backend:** {error}")
             st.info("**Troubleshooting Steps:**")
@@ -77,13 +218,12 @@ def check_backend_connection():
             st.info("**Backend Status Details:**")
             
             # Show service status if available
-            services = health_status.get('services', {})
-            if services:
-                for service_name, service_status in services.items():
-                    if 'error' in str(service_status):
-                        st.error(f"❌ {service_name}: {service_status}")
-                    else:
-                        st.success(f"✅ {service_name}: {service_status}")
+            for service_name, service_status in services.items():
+                service_text = str(service_status)
+                if 'error' in service_text:
+                    st.error(f"❌ {service_name}: {service_text}")
+                else:
+                    st.success(f"✅ {service_name}: {service_text}")
             
             st.info("**Possible Solutions:**")
             st.markdown("""
@@ -115,9 +255,8 @@ def check_backend_connection():
             # Test basic connectivity
             st.write("**Testing connectivity to backend...**")
             try:
-                import requests
-                response = requests.get("http://localhost:8000", timeout=5)
-                st.success(f"✅ Basic HTTP connection successful (Status: {response.status_code})")
+                status_code = api_client.ping()
+                st.success(f"✅ Basic HTTP connection successful (Status: {status_code})")
             except Exception as e:
                 st.error(f"❌ Basic HTTP connection failed: {str(e)}")
             
@@ -146,18 +285,7 @@ def main():
     
     # Title and description
     st.title("🤖 Multi-Agent Code Generator")
-    st.markdown("""
-    Transform your ideas into complete Python applications using our AI-powered multi-agent system.
-    Simply describe what you want to build, and our specialized agents will:
-    
-    - 📋 Analyze your requirements
-    - 💻 Generate production-ready code
-    - 🔍 Review and optimize the code
-    - 📚 Create comprehensive documentation
-    - 🧪 Generate test cases
-    - 🚀 Create deployment configurations
-    - 🎨 Build a Streamlit user interface
-    """)
+    st.markdown(DESCRIPTION_MD)
     
     # Sidebar for navigation and info
     with st.sidebar:
@@ -197,7 +325,7 @@ def show_code_generator():
     # Pipeline Status Section
     with st.expander("📊 Pipeline Status", expanded=False):
         try:
-            status = api_client.get_pipeline_status()
+            status = get_pipeline_status_cached()
             if status:
                 # Current progress
                 st.subheader("Current Progress")
@@ -260,8 +388,9 @@ def show_code_generator():
                             st.success("✅ Test progress created successfully!")
                             st.json(test_result)
                             
-                            # Show the test progress
+                            # Show the test progress; fresh test data starts a fresh view
                             st.markdown("### Test Progress Display")
+                            st.session_state.pop(f"progress_{test_project_id}", None)
                             show_generation_progress(test_project_id)
                         else:
                             st.error("❌ Failed to create test progress")
@@ -270,22 +399,11 @@ def show_code_generator():
     
     # Quick Examples
     st.subheader("Quick Examples")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("📊 Data Analysis Tool", use_container_width=True):
-            st.session_state.example_input = "Create a data analysis tool that reads CSV files, performs statistical analysis, generates visualizations, and exports reports in PDF format."
-            st.rerun()
-    
-    with col2:
-        if st.button("🌐 Web API", use_container_width=True):
-            st.session_state.example_input = "Build a REST API for a task management system with user authentication, CRUD operations for tasks, and email notifications."
-            st.rerun()
-    
-    with col3:
-        if st.button("🤖 Chatbot", use_container_width=True):
-            st.session_state.example_input = "Create an intelligent chatbot that can answer questions about a knowledge base, with conversation history and context awareness."
-            st.rerun()
+    for column, (label, example_input) in zip(st.columns(len(EXAMPLES)), EXAMPLES):
+        with column:
+            if st.button(label, use_container_width=True):
+                st.session_state.example_input = example_input
+                st.rerun()
     
     # Input form
     with st.form("code_generation_form"):
@@ -314,7 +432,11 @@ def show_code_generator():
         
         # Validation
         if user_input:
-            validation = api_client.validate_input(user_input)
+            try:
+                validation = validate_input_cached(user_input)
+            except RuntimeError:
+                # Validation is advisory; skip it while the backend is unavailable
+                validation = None
             
             if validation and validation.get('warnings'):
                 for warning in validation['warnings']:
@@ -340,6 +462,13 @@ def show_code_generator():
         generate_application(user_input, project_name)
     elif submitted:
         st.error("Please provide a description of what you want to build.")
+    elif st.session_state.get('current_project_id'):
+        # A widget interaction reran the script mid-generation; resume tracking it
+        project_id = st.session_state.current_project_id
+        show_generation_progress(project_id)
+        st.session_state.pop('current_project_id', None)
+        # The finished project belongs in the history right away
+        get_dashboard_cached.clear()
 
 def generate_application(user_input: str, project_name: str = None):
     """Generate application using the backend API."""
@@ -362,14 +491,33 @@ def generate_application(user_input: str, project_name: str = None):
         # Store project ID in session state
         st.session_state.current_project_id = project_id
         
-        # Show progress tracking
+        # Show progress tracking; a rerun interrupts this by raising, so the ID is only
+        # dropped once tracking has actually finished
         show_generation_progress(project_id)
+        st.session_state.pop('current_project_id', None)
+        # The finished project belongs in the history right away
+        get_dashboard_cached.clear()
         
     except Exception as e:
         st.error(f"❌ Generation failed: {str(e)}")
 
 def show_generation_progress(project_id: str):
     """Show real-time progress for a generation."""
+    state_key = f"progress_{project_id}"
+    # Tracking state that survives reruns, so an interrupted view resumes where it left off
+    state = st.session_state.setdefault(state_key, {
+        'seen_progress': False,
+        'percentage': 0,
+        'ui_generation': False
+    })
+    
+    track_generation_progress(project_id, state)
+    # A rerun interrupts tracking by raising, so this only runs once tracking has ended
+    # and the next view of this project starts fresh
+    st.session_state.pop(state_key, None)
+
+def track_generation_progress(project_id: str, state: dict):
+    """Render progress for a generation until it completes, fails or times out."""
     
     st.subheader("🚀 Generation in Progress")
     
@@ -377,7 +525,8 @@ def show_generation_progress(project_id: str):
     status_text = st.empty()
     status_text.info("🔍 **Checking project status...**")
     
-    completion_status = api_client.check_project_completion_fallback(project_id)
+    # A resumed view already knows the project was running; the progress stream reports completion
+    completion_status = None if state['seen_progress'] else api_client.check_project_completion_fallback(project_id)
     
     if completion_status and completion_status.get('is_completed'):
         # Project is already completed! Show results immediately
@@ -388,18 +537,8 @@ def show_generation_progress(project_id: str):
         
         # Show pipeline steps as completed
         st.markdown("### 📋 Pipeline Steps")
-        step_names = [
-            "Requirements Analysis",
-            "Code Generation", 
-            "Code Review",
-            "Documentation",
-            "Test Generation",
-            "Deployment Config",
-            "UI Generation"
-        ]
-        
-        for i, step_name in enumerate(step_names):
-            st.success(f"✅ **{i+1}. {step_name}** - Completed")
+        # All steps are done, so render them as one widget instead of one per step
+        st.success("  \n".join(COMPLETED_TEMPLATES))
         
         # Display the results immediately
         result = completion_status.get('result')
@@ -419,19 +558,9 @@ def show_generation_progress(project_id: str):
     # Show pipeline steps
     st.markdown("### 📋 Pipeline Steps")
     step_placeholders = []
-    step_names = [
-        "Requirements Analysis",
-        "Code Generation", 
-        "Code Review",
-        "Documentation",
-        "Test Generation",
-        "Deployment Config",
-        "UI Generation"
-    ]
-    
-    for i, step_name in enumerate(step_names):
+    for waiting_label in WAITING_TEMPLATES:
         placeholder = st.empty()
-        placeholder.info(f"⏳ **{i+1}. {step_name}** - Waiting")
+        placeholder.info(waiting_label)
         step_placeholders.append(placeholder)
     
     # Add cancel button
@@ -445,13 +574,31 @@ def show_generation_progress(project_id: str):
                 st.error("Failed to cancel generation")
     
     # Enhanced poll for progress updates with smart completion detection
-    max_polls = 30  # Reduced to 30 attempts (30 seconds) before checking completion fallback
+    deadline = time.monotonic() + PROGRESS_DEADLINE
     poll_count = 0
+    poll_interval = PROGRESS_POLL_MIN_INTERVAL
+    last_seen_percentage = None
+    backoff_reset_for_ui = False
+    # Last rendered (status, rounded progress) per step, so unchanged widgets aren't rewritten
+    prev_states = [('pending', 0)] * len(step_placeholders)
+    prev_debug_percentage = None
     consecutive_errors = 0
-    last_progress_percentage = 0
-    ui_generation_detected = False
+    last_progress_percentage = state['percentage']
+    ui_generation_detected = state['ui_generation']
     extended_timeout_used = False
     completion_checked = False
+    last_seq = -1
+    progress_events = None
+    final_result = None
+    columns = None
+    
+    last_status = {}
+    
+    def set_status(level, message):
+        """Write the status line only when its level or text changed since the last write."""
+        if last_status.get('value') != (level, message):
+            last_status['value'] = (level, message)
+            getattr(status_text, level)(message)
     
     def check_completion_and_display(reason=""):
         """Helper function to check completion and display results if found."""
@@ -459,12 +606,12 @@ def show_generation_progress(project_id: str):
             completion_status = api_client.check_project_completion_fallback(project_id)
             if completion_status and completion_status.get('is_completed'):
                 # Project is already completed! Show success and results
-                status_text.success(f"✅ **Project Already Completed!** {reason}")
+                set_status('success', f"✅ **Project Already Completed!** {reason}")
                 progress_bar.progress(1.0)
                 
                 # Update all steps to completed
-                for j, step_name_j in enumerate(step_names):
-                    step_placeholders[j].success(f"✅ **{j+1}. {step_name_j}** - Completed")
+                for j, completed_label in enumerate(COMPLETED_TEMPLATES):
+                    step_placeholders[j].success(completed_label)
                 
                 # Display the results immediately
                 result = completion_status.get('result')
@@ -479,10 +626,12 @@ def show_generation_progress(project_id: str):
             st.warning(f"Completion check failed: {str(e)}")
         return False
     
-    while poll_count < max_polls:
+    while time.monotonic() < deadline:
         try:
-            # AGGRESSIVE COMPLETION CHECK - Check every 3rd poll during suspected UI generation
-            if poll_count > 0 and (last_progress_percentage > 85 or ui_generation_detected) and poll_count % 3 == 0:
+            # AGGRESSIVE COMPLETION CHECK - Check every 3rd poll during suspected UI generation.
+            # Not needed while the progress stream is live: it delivers completion with the result.
+            if (progress_events is None and poll_count > 0 and
+                    (last_progress_percentage > 85 or ui_generation_detected) and poll_count % 3 == 0):
                 if check_completion_and_display(f"(Periodic check #{poll_count//3})"):
                     return
             
@@ -494,7 +643,7 @@ def show_generation_progress(project_id: str):
                     if last_progress_percentage > 85:  # Likely in UI generation phase
                         if not ui_generation_detected:
                             ui_generation_detected = True
-                            status_text.info("🎨 **Entering UI Generation Phase** - Checking completion...")
+                            set_status('info', "🎨 **Entering UI Generation Phase** - Checking completion...")
                             # IMMEDIATE COMPLETION CHECK when entering UI generation
                             if check_completion_and_display("(UI Generation entry)"):
                                 return
@@ -502,8 +651,23 @@ def show_generation_progress(project_id: str):
                 except:
                     pass
             
-            # Get progress with appropriate timeout
-            progress = api_client.get_project_progress(project_id, extended_timeout=extended_timeout_used)
+            # The backend pushes an event when progress changes; long-poll if the stream is unavailable
+            progress = None
+            try:
+                if progress_events is None:
+                    progress_events = api_client.stream_project_progress(project_id, last_seq)
+                update = next(progress_events, None)
+                if update is None:
+                    progress_events = None
+            except Exception:
+                progress_events = None
+                time.sleep(2)  # Pause before reconnecting
+                update = api_client.get_project_progress_longpoll(project_id, last_seq, wait=PROGRESS_LONGPOLL_WAIT)
+            if update:
+                last_seq = update.get('seq', last_seq)
+                progress = update.get('progress')
+                final_result = update.get('result')
+                columns = update.get('step_columns')
             
             if progress:
                 consecutive_errors = 0  # Reset error counter on success
@@ -512,36 +676,46 @@ def show_generation_progress(project_id: str):
                 progress_percentage = progress.get('progress_percentage', 0)
                 if progress_percentage > last_progress_percentage:
                     last_progress_percentage = progress_percentage
+                state['seen_progress'] = True
+                state['percentage'] = last_progress_percentage
                 progress_bar.progress(progress_percentage / 100)
                 
-                # Show debug info in expander
-                with debug_info.expander("🔍 Debug Info", expanded=False):
-                    st.json({
-                        'progress_percentage': progress_percentage,
-                        'is_running': progress.get('is_running', False),
-                        'is_completed': progress.get('is_completed', False),
-                        'has_failures': progress.get('has_failures', False),
-                        'completed_steps': progress.get('completed_steps', 0),
-                        'total_steps': progress.get('total_steps', 0),
-                        'poll_count': poll_count,
-                        'ui_generation_detected': ui_generation_detected,
-                        'extended_timeout_used': extended_timeout_used,
-                        'consecutive_errors': consecutive_errors
-                    })
-                
-                # Update status text
+                # Terminal tick: report and stop before touching the debug or step widgets
                 if progress.get('is_completed'):
-                    status_text.success("✅ **Generation Completed Successfully!**")
+                    set_status('success', "✅ **Generation Completed Successfully!**")
+                    if final_result:
+                        # The backend sent the result with the final update
+                        display_results(final_result)
+                        return
                     break
                 elif progress.get('has_failures'):
-                    status_text.error("❌ **Generation Failed**")
+                    set_status('error', "❌ **Generation Failed**")
                     # Show error details if available
                     logs = progress.get('logs', [])
-                    error_logs = [log for log in logs if log.get('level') == 'ERROR']
-                    if error_logs:
-                        st.error(f"Error details: {error_logs[-1].get('message', 'Unknown error')}")
+                    last_error = next((log for log in reversed(logs) if log.get('level') == 'ERROR'), None)
+                    if last_error:
+                        st.error(f"Error details: {last_error.get('message', 'Unknown error')}")
                     break
-                elif progress.get('is_running'):
+                
+                # Show debug info in expander (refreshed on change, and every 10th poll for the counters)
+                if progress_percentage != prev_debug_percentage or poll_count % 10 == 0:
+                    prev_debug_percentage = progress_percentage
+                    with debug_info.expander("🔍 Debug Info", expanded=False):
+                        st.json({
+                            'progress_percentage': progress_percentage,
+                            'is_running': progress.get('is_running', False),
+                            'is_completed': progress.get('is_completed', False),
+                            'has_failures': progress.get('has_failures', False),
+                            'completed_steps': progress.get('completed_steps', 0),
+                            'total_steps': progress.get('total_steps', 0),
+                            'poll_count': poll_count,
+                            'ui_generation_detected': ui_generation_detected,
+                            'extended_timeout_used': extended_timeout_used,
+                            'consecutive_errors': consecutive_errors
+                        })
+                
+                # Update status text
+                if progress.get('is_running'):
                     current_step_info = progress.get('current_step_info')
                     if current_step_info:
                         step_desc = current_step_info.get('description', 'Processing...')
@@ -551,18 +725,18 @@ def show_generation_progress(project_id: str):
                         if agent_name == 'ui_designer' or 'UI' in step_desc:
                             if not ui_generation_detected:
                                 ui_generation_detected = True
-                                status_text.info("🎨 **Starting UI Generation** - Checking completion status...")
+                                set_status('info', "🎨 **Starting UI Generation** - Checking completion status...")
                                 
                                 # IMMEDIATE COMPLETION CHECK FOR UI GENERATION
                                 completion_status = api_client.check_project_completion_fallback(project_id)
                                 if completion_status and completion_status.get('is_completed'):
                                     # Project is already completed! Show success and results
-                                    status_text.success("✅ **Project Already Completed!**")
+                                    set_status('success', "✅ **Project Already Completed!**")
                                     progress_bar.progress(1.0)
                                     
                                     # Update all steps to completed
-                                    for j, step_name_j in enumerate(step_names):
-                                        step_placeholders[j].success(f"✅ **{j+1}. {step_name_j}** - Completed")
+                                    for j, completed_label in enumerate(COMPLETED_TEMPLATES):
+                                        step_placeholders[j].success(completed_label)
                                     
                                     # Display the results immediately
                                     result = completion_status.get('result')
@@ -574,72 +748,75 @@ def show_generation_progress(project_id: str):
                                         st.warning("Project completed but results are being processed. Please check Project History.")
                                         return
                                 
-                                status_text.info("🎨 **Starting UI Generation** - This step may take longer due to AI processing...")
+                                set_status('info', "🎨 **Starting UI Generation** - This step may take longer due to AI processing...")
                             else:
-                                status_text.info(f"🎨 **{step_desc}** - AI is generating your interface...")
+                                set_status('info', f"🎨 **{step_desc}** - AI is generating your interface...")
                         elif agent_name:
-                            status_text.info(f"🔄 **{step_desc}** (Agent: {agent_name})")
+                            set_status('info', f"🔄 **{step_desc}** (Agent: {agent_name})")
                         else:
-                            status_text.info(f"🔄 **{step_desc}**")
+                            set_status('info', f"🔄 **{step_desc}**")
                     else:
                         if ui_generation_detected:
-                            status_text.info(f"🎨 **UI Generation in Progress...** ({progress_percentage:.1f}% complete)")
+                            set_status('info', f"🎨 **UI Generation in Progress...** ({progress_percentage:.1f}% complete)")
                         else:
-                            status_text.info(f"🔄 **Processing...** ({progress_percentage:.1f}% complete)")
+                            set_status('info', f"🔄 **Processing...** ({progress_percentage:.1f}% complete)")
                 else:
-                    status_text.info(f"⏳ **Initializing...** ({progress_percentage:.1f}% complete)")
+                    set_status('info', f"⏳ **Initializing...** ({progress_percentage:.1f}% complete)")
                 
                 # Update individual step displays
-                steps = progress.get('steps', [])
-                for i, step in enumerate(steps):
+                # Prefer the backend's parallel status/progress lists over per-step dicts
+                if columns:
+                    step_states = list(zip(columns['status'], columns['progress']))
+                else:
+                    step_states = [(step.get('status', 'pending'), step.get('progress_percentage', 0))
+                                   for step in progress.get('steps', [])]
+                for i, (status, step_progress) in enumerate(step_states):
                     if i < len(step_placeholders):
-                        step_name = step_names[i] if i < len(step_names) else f"Step {i+1}"
-                        status = step.get('status', 'pending')
-                        step_progress = step.get('progress_percentage', 0)
+                        step_name = STEP_NAMES[i] if i < len(STEP_NAMES) else f"Step {i+1}"
+                        
+                        new_state = (status, round(step_progress))
+                        if new_state == prev_states[i]:
+                            continue
+                        prev_states[i] = new_state
                         
-                        if status == 'running':
+                        if status == 'running' and i == 6:
                             # Special handling for UI generation step (step 7)
-                            if i == 6:  # UI Generation step
-                                # Check if project is already completed when UI generation starts
-                                if not ui_generation_detected:
-                                    ui_generation_detected = True
-                                    status_text.info("🎨 **Starting UI Generation** - Checking completion status...")
-                                    
-                                    # SMART COMPLETION CHECK FOR UI GENERATION
-                                    completion_status = api_client.check_project_completion_fallback(project_id)
-                                    if completion_status and completion_status.get('is_completed'):
-                                        # Project is already completed! Show success and results
-                                        status_text.success("✅ **Project Already Completed!**")
-                                        progress_bar.progress(1.0)
-                                        
-                                        # Update all steps to completed
-                                        for j, step_name_j in enumerate(step_names):
-                                            step_placeholders[j].success(f"✅ **{j+1}. {step_name_j}** - Completed")
-                                        
-                                        # Display the results immediately
-                                        result = completion_status.get('result')
-                                        if result:
-                                            st.success("🎉 Project completed! Found via smart UI generation detection.")
-                                            display_results(result, use_expanders=False)
-                                            return
-                                        else:
-                                            st.warning("Project completed but results are being processed. Please check Project History.")
-                                            return
+                            # Check if project is already completed when UI generation starts
+                            if not ui_generation_detected:
+                                ui_generation_detected = True
+                                set_status('info', "🎨 **Starting UI Generation** - Checking completion status...")
                                 
-                                step_placeholders[i].info(f"🎨 **{i+1}. {step_name}** - AI Processing ({step_progress:.0f}%)")
-                            else:
-                                step_placeholders[i].info(f"🔄 **{i+1}. {step_name}** - Running ({step_progress:.0f}%)")
-                        elif status == 'completed':
-                            step_placeholders[i].success(f"✅ **{i+1}. {step_name}** - Completed")
-                        elif status == 'failed':
-                            step_placeholders[i].error(f"❌ **{i+1}. {step_name}** - Failed")
-                        else:
-                            step_placeholders[i].info(f"⏳ **{i+1}. {step_name}** - Waiting")
+                                # SMART COMPLETION CHECK FOR UI GENERATION
+                                completion_status = api_client.check_project_completion_fallback(project_id)
+                                if completion_status and completion_status.get('is_completed'):
+                                    # Project is already completed! Show success and results
+                                    set_status('success', "✅ **Project Already Completed!**")
+                                    progress_bar.progress(1.0)
+                                    
+                                    # Update all steps to completed
+                                    for j, completed_label in enumerate(COMPLETED_TEMPLATES):
+                                        step_placeholders[j].success(completed_label)
+                                    
+                                    # Display the results immediately
+                                    result = completion_status.get('result')
+                                    if result:
+                                        st.success("🎉 Project completed! Found via smart UI generation detection.")
+                                        display_results(result, use_expanders=False)
+                                        return
+                                    else:
+                                        st.warning("Project completed but results are being processed. Please check Project History.")
+                                        return
+                            
+                            status = 'ui_running'
+                        
+                        method, template = STATUS_FMT.get(status, STATUS_FMT['pending'])
+                        getattr(step_placeholders[i], method)(template.format(n=i+1, name=step_name, p=step_progress))
                 
                 # Update remaining steps as waiting if we have fewer steps than expected
-                for i in range(len(steps), len(step_placeholders)):
-                    step_name = step_names[i] if i < len(step_names) else f"Step {i+1}"
-                    step_placeholders[i].info(f"⏳ **{i+1}. {step_name}** - Waiting")
+                for i in range(len(step_states), len(step_placeholders)):
+                    if prev_states[i] != ('pending', 0):
+                        prev_states[i] = ('pending', 0)
+                        step_placeholders[i].info(WAITING_TEMPLATES[i])
             
             else:
                 consecutive_errors += 1
@@ -654,25 +831,31 @@ def show_generation_progress(project_id: str):
                     pass
                 elif consecutive_errors <= 8:
                     if ui_generation_detected:
-                        status_text.warning(f"⚠️ UI Generation in progress, waiting for response... (attempt {consecutive_errors})")
+                        set_status('warning', f"⚠️ UI Generation in progress, waiting for response... (attempt {consecutive_errors})")
                     else:
-                        status_text.warning(f"⚠️ Waiting for progress data... (attempt {consecutive_errors})")
+                        set_status('warning', f"⚠️ Waiting for progress data... (attempt {consecutive_errors})")
                 elif consecutive_errors <= 20:  # Increased tolerance for UI generation
                     if ui_generation_detected:
-                        status_text.warning(f"⚠️ UI Generation is taking longer than usual. AI processing can be intensive... (attempt {consecutive_errors})")
+                        set_status('warning', f"⚠️ UI Generation is taking longer than usual. AI processing can be intensive... (attempt {consecutive_errors})")
                     else:
-                        status_text.warning(f"⚠️ No progress data received for {consecutive_errors} consecutive attempts. Pipeline may still be initializing...")
+                        set_status('warning', f"⚠️ No progress data received for {consecutive_errors} consecutive attempts. Pipeline may still be initializing...")
                 else:
-                    status_text.error("❌ Lost connection to backend or pipeline failed to start. Please check if the backend is running.")
+                    set_status('error', "❌ Lost connection to backend or pipeline failed to start. Please check if the backend is running.")
                     break
             
-            # Adaptive sleep interval
-            if ui_generation_detected and consecutive_errors > 0:
-                time.sleep(3)  # Longer interval during UI generation with errors
-            elif ui_generation_detected:
-                time.sleep(2)  # Slightly longer interval during UI generation
-            else:
-                time.sleep(1)  # Normal interval
+            # Back off while nothing changes; a streamed or long-polled update already waited server-side.
+            # Entering UI generation also resets it, since completion is usually close by then.
+            state['ui_generation'] = ui_generation_detected
+            if ui_generation_detected and not backoff_reset_for_ui:
+                backoff_reset_for_ui = True
+                poll_interval = PROGRESS_POLL_MIN_INTERVAL
+            if progress and progress.get('progress_percentage', 0) != last_seen_percentage:
+                last_seen_percentage = progress.get('progress_percentage', 0)
+                poll_interval = PROGRESS_POLL_MIN_INTERVAL
+            elif not progress:
+                # Jitter keeps several open sessions from retrying in lockstep
+                time.sleep(poll_interval * random.uniform(0.8, 1.2))
+                poll_interval = min(poll_interval * 2, PROGRESS_POLL_MAX_INTERVAL)
             
             poll_count += 1
             
@@ -683,9 +866,9 @@ def show_generation_progress(project_id: str):
             if consecutive_errors <= 3:
                 # Show temporary error message
                 if ui_generation_detected:
-                    status_text.warning(f"⚠️ UI Generation connection issue (attempt {consecutive_errors}/3): {error_msg}")
+                    set_status('warning', f"⚠️ UI Generation connection issue (attempt {consecutive_errors}/3): {error_msg}")
                 else:
-                    status_text.warning(f"⚠️ Connection issue (attempt {consecutive_errors}/3): {error_msg}")
+                    set_status('warning', f"⚠️ Connection issue (attempt {consecutive_errors}/3): {error_msg}")
             elif consecutive_errors <= 15:  # Increased tolerance
                 # Show persistent warning
                 if ui_generation_detected:
@@ -705,20 +888,20 @@ def show_generation_progress(project_id: str):
             poll_count += 1
     
     # Handle timeout or completion check
-    if poll_count >= max_polls:
-        status_text.info("🔍 **Checking if project completed...**")
+    if time.monotonic() >= deadline:
+        set_status('info', "🔍 **Checking if project completed...**")
         
         # Smart completion detection - check if project actually completed
         completion_status = api_client.check_project_completion_fallback(project_id)
         
         if completion_status and completion_status.get('is_completed'):
             # Project is completed! Show success and results
-            status_text.success("✅ **Project Completed Successfully!**")
+            set_status('success', "✅ **Project Completed Successfully!**")
             progress_bar.progress(1.0)
             
             # Update all steps to completed
-            for i, step_name in enumerate(step_names):
-                step_placeholders[i].success(f"✅ **{i+1}. {step_name}** - Completed")
+            for i, completed_label in enumerate(COMPLETED_TEMPLATES):
+                step_placeholders[i].success(completed_label)
             
             # Display the results
             result = completion_status.get('result')
@@ -806,6 +989,8 @@ def show_generation_progress(project_id: str):
 
 def display_results(results: Dict[str, Any], use_expanders: bool = True):
     """Display the generated application results."""
+    # Only needed for the JSON download, so it isn't imported on every rerun of the page
+    import json
     
     st.success("🎉 Your application has been generated successfully!")
     
@@ -867,7 +1052,7 @@ def display_results(results: Dict[str, Any], use_expanders: bool = True):
             # Download button
             st.download_button(
                 label="📥 Download main.py",
-                data=final_code,
+                data=final_code.encode("utf-8"),
                 file_name=f"{results.get('project_name', 'project')}_main.py",
                 mime="text/plain"
             )
@@ -884,7 +1069,7 @@ def display_results(results: Dict[str, Any], use_expanders: bool = True):
             # Download button
             st.download_button(
                 label="📥 Download README.md",
-                data=readme,
+                data=readme.encode("utf-8"),
                 file_name=f"{results.get('project_name', 'project')}_README.md",
                 mime="text/plain"
             )
@@ -901,7 +1086,7 @@ def display_results(results: Dict[str, Any], use_expanders: bool = True):
             # Download button
             st.download_button(
                 label="📥 Download test_main.py",
-                data=test_code,
+                data=test_code.encode("utf-8"),
                 file_name=f"{results.get('project_name', 'project')}_test_main.py",
                 mime="text/plain"
             )
@@ -918,7 +1103,7 @@ def display_results(results: Dict[str, Any], use_expanders: bool = True):
             # Download button
             st.download_button(
                 label="📥 Download deployment.md",
-                data=deployment_configs,
+                data=deployment_configs.encode("utf-8"),
                 file_name=f"{results.get('project_name', 'project')}_deployment.md",
                 mime="text/plain"
             )
@@ -935,7 +1120,7 @@ def display_results(results: Dict[str, Any], use_expanders: bool = True):
             # Download button
             st.download_button(
                 label="📥 Download streamlit_app.py",
-                data=streamlit_app,
+                data=streamlit_app.encode("utf-8"),
                 file_name=f"{results.get('project_name', 'project')}_streamlit_app.py",
                 mime="text/plain"
             )
@@ -944,12 +1129,14 @@ def display_results(results: Dict[str, Any], use_expanders: bool = True):
     
     with tabs[6]:  # Full Results
         st.subheader("📄 Complete Results (JSON)")
-        st.json(results)
+        # Serialize once; st.json renders a JSON string as-is instead of dumping the dict again
+        serialized = json.dumps(results, indent=2, default=str)
+        st.json(serialized)
         
         # Download full results
         st.download_button(
             label="📥 Download Full Results (JSON)",
-            data=json.dumps(results, indent=2, default=str),
+            data=serialized.encode("utf-8"),
             file_name=f"{results.get('project_name', 'project')}_full_results.json",
             mime="application/json"
         )
@@ -960,7 +1147,7 @@ def show_agent_info():
     st.header("🤖 Agent Information")
     
     try:
-        agent_info = api_client.get_agents_info()
+        agent_info = get_agents_info_cached()
         
         if not agent_info:
             st.error("Failed to load agent information")
@@ -1003,9 +1190,14 @@ def show_project_history():
     
     st.header("📚 Project History")
     
+    # Expanders and paging rerun the page; only this button forces a new fetch
+    if st.button("🔄 Refresh history", key="refresh_history"):
+        get_dashboard_cached.clear()
+    
     try:
-        # Get project statistics
-        stats = api_client.get_project_statistics()
+        # Statistics and history come back from one bundled request
+        dashboard = get_dashboard_cached()
+        stats = dashboard['statistics']
         
         if stats:
             # Summary statistics
@@ -1025,8 +1217,8 @@ def show_project_history():
                 success_rate = stats.get('success_rate', 0)
                 st.metric("Success Rate", f"{success_rate:.1f}%")
         
-        # Get project history
-        history = api_client.get_project_history(limit=20)
+        # Project history
+        history = dashboard['history']
         
         if not history or not history.get('projects'):
             st.info("No projects generated yet. Start by creating your first application!")
@@ -1035,35 +1227,29 @@ def show_project_history():
         # Project list
         st.subheader("Recent Projects")
         
-        projects = history.get('projects', [])
-        for i, project in enumerate(projects, 1):
-            with st.expander(f"Project {i}: {project.get('project_name', 'Unknown')}"):
+        # Hashable input so the prepared rows are cached per history payload; only the
+        # first 201 characters of the input matter for the 200-character preview
+        projects = tuple(
+            (project.get('project_name', 'Unknown'), project.get('timestamp', ''), project.get('success'),
+             project.get('execution_time', 0), project.get('user_input', '')[:201], project.get('error'))
+            for project in history.get('projects', [])
+        )
+        rows = prepare_history_rows(projects)
+        
+        # Render one page of expanders per rerun instead of the whole history
+        page_count = max(1, (len(rows) + HISTORY_PAGE_SIZE - 1) // HISTORY_PAGE_SIZE)
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="history_page") if page_count > 1 else 1
+        start = (page - 1) * HISTORY_PAGE_SIZE
+        
+        for i, (name, formatted_time, success_icon, exec_time_str, display_input, error) in enumerate(rows[start:start + HISTORY_PAGE_SIZE], start + 1):
+            with st.expander(f"Project {i}: {name}"):
                 col1, col2 = st.columns(2)
                 
-                with col1:
-                    timestamp = project.get('timestamp', '')
-                    if isinstance(timestamp, str):
-                        try:
-                            # Parse ISO timestamp
-                            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                            formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            formatted_time = timestamp
-                    else:
-                        formatted_time = str(timestamp)
-                    
-                    st.write(f"**Timestamp:** {formatted_time}")
-                    st.write(f"**Success:** {'✅' if project.get('success') else '❌'}")
-                    st.write(f"**Execution Time:** {project.get('execution_time', 0):.2f}s")
-                
-                with col2:
-                    st.write("**User Input:**")
-                    user_input = project.get('user_input', '')
-                    display_input = user_input[:200] + "..." if len(user_input) > 200 else user_input
-                    st.write(display_input)
+                # One element per column rather than one per line
+                col1.markdown(f"**Timestamp:** {formatted_time}  \n**Success:** {success_icon}  \n**Execution Time:** {exec_time_str}")
+                col2.markdown(f"**User Input:**\n\n{display_input}")
                 
-                error = project.get('error')
-                if not project.get('success') and error:
+                if error:
                     st.error(f"Error: {error}")
                     
     except Exception as e:
@@ -5,7 +5,7 @@ with emphasis on the Code Generation and Code Review looping mechanism.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, ConnectionPatch
+from matplotlib.patches import FancyBboxPatch
 import numpy as np
 
 def create_pipeline_diagram():
@@ -27,17 +27,27 @@ def main():
     # Add backend directory to Python path
     sys.path.insert(0, backend_dir)
     
-    logger.info("Starting FastAPI backend server...")
-    logger.info("Backend will be available at: http://localhost:8000")
-    logger.info("API documentation will be available at: http://localhost:8000/docs")
+    # BACKEND_UDS serves the API on a Unix domain socket instead of TCP, for a
+    # frontend on the same host (it must be started with the same BACKEND_UDS)
+    uds_path = os.environ.get("BACKEND_UDS")
+    if uds_path:
+        bind_args = ["--uds", uds_path]
+        logger.info("Starting FastAPI backend server...")
+        logger.info(f"Backend will be available on Unix socket: {uds_path}")
+    else:
+        bind_args = ["--host", "0.0.0.0", "--port", "8000"]
+        logger.info("Starting FastAPI backend server...")
+        logger.info("Backend will be available at: http://localhost:8000")
+        logger.info("API documentation will be available at: http://localhost:8000/docs")
     
     try:
         # Start the FastAPI server
         subprocess.run([
             sys.executable, "-m", "uvicorn", 
             "main:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000", 
+            *bind_args,
+            # Outlive the frontend's 60s idle keep-alive so pooled connections aren't cut under it
+            "--timeout-keep-alive", "65",
             "--reload"
         ], check=True)
     except KeyboardInterrupt: